@@ -2,27 +2,28 @@
 Eski LayerManager by Claude
 A dockable layer and object manager for 3ds Max
 
-Version: 0.25.6 (2026-04-22 17:03)
+Version: 0.25.95 (2026-10-17 01:08)
 """
 
+import bisect
+import functools
+import traceback
+
 from PySide6 import QtWidgets, QtCore, QtGui
+from shiboken6 import isValid
 
 # Import pymxs (required for 3ds Max API access)
 try:
     from pymxs import runtime as rt
-    pass  # Debug print removed
 except ImportError as e:
     # For development/testing outside 3ds Max
     rt = None
-    pass  # Debug print removed
 
 # Import MaxPlus (optional - deprecated in 3ds Max 2023+)
 try:
     import MaxPlus
-    pass  # Debug print removed
 except ImportError:
     MaxPlus = None
-    pass  # Debug print removed
 
 # Try to import qtmax for docking functionality
 try:
@@ -33,15 +34,233 @@ except ImportError:
     print("Warning: qtmax not available. Window will not be dockable.")
 
 
-VERSION = "0.25.6 (2026-04-22 17:03)"
+VERSION = "0.25.95 (2026-10-17 01:08)"
 VERSION_DISPLAY_DURATION = 10000  # Show version for 10 seconds before tips
+DEBUG = False  # Print full tracebacks on errors (development only)
+_RIGHT_DOCK = QtCore.Qt.RightDockWidgetArea  # Default dock area, bound once for show_layer_manager()
+SYNC_INTERVAL = 500  # Sync poll interval (ms) while 3ds Max state is changing
+SYNC_IDLE_INTERVAL = 2000  # Slower sync poll interval (ms) once nothing has changed for a while
+SYNC_IDLE_TICKS = 10  # Unchanged polls before switching to SYNC_IDLE_INTERVAL
+# #custom file-properties category, interned once instead of per position read/write
+_CUSTOM_PROPS = rt.Name("custom") if rt is not None else None
 
 # Module initialization guard - prevents re-initialization on repeated imports
 if '_ESKI_LAYER_MANAGER_INITIALIZED' not in globals():
     _ESKI_LAYER_MANAGER_INITIALIZED = True
-    # Global instance variable - use a list to prevent garbage collection
-    # List makes it a mutable container that survives module namespace issues
-    _layer_manager_instance = [None]
+    # Global instance variable - rebound via `global`, kept alive by the module namespace
+    _layer_manager_instance = None
+
+# Versions before 0.25.19 kept the instance in a one-element list - the installer's in-place
+# reload skips the guard above, so unwrap the old form here
+if isinstance(_layer_manager_instance, list):
+    _layer_manager_instance = _layer_manager_instance[0] if _layer_manager_instance else None
+
+# {scene file path: position string} last read from or written to the scene's file properties
+# (defined outside the guard - the installer's reload of an older version skips it)
+_position_cache = globals().get('_position_cache', {})
+
+# _CALLBACK_FNS already run this session (MaxScript globals outlive instances and reloads)
+_callback_fns_defined = globals().get('_callback_fns_defined', False)
+
+# _on_about_to_quit is connected to the application once per session (survives reloads)
+_quit_hook_connected = globals().get('_quit_hook_connected', False)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_max_icon(path):
+    """
+    Load a 3ds Max multi-res icon by path, or None if it is missing or has no pixel data
+    Cached per path (misses included) so Max resolves each candidate at most once per session
+    """
+    if not QTMAX_AVAILABLE:
+        return None
+    try:
+        icon = qtmax.LoadMaxMultiResIcon(path)
+    except Exception:
+        return None
+    if icon and not icon.isNull() and len(icon.availableSizes()) > 0:
+        return icon
+    return None
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_position_data(position_data):
+    """
+    Parse a saved "floating;dock_area;x;y;width;height;relative_above;relative_below" string
+    Cached per string (callers only read the dict) so repeated restores skip the split/int parsing
+    Returns None for an unrecognised format
+    """
+    parts = position_data.split(";")
+
+    # Support multiple formats for backwards compatibility
+    if len(parts) == 8:
+        # New format: floating;dock_area;x;y;width;height;relative_above;relative_below
+        result = {
+            'floating': parts[0] == "True",
+            'dock_area': parts[1],
+            'x': int(parts[2]),
+            'y': int(parts[3]),
+            'width': int(parts[4]),
+            'height': int(parts[5]),
+            'relative_above': parts[6] if parts[6] != "none" else None,
+            'relative_below': parts[7] if parts[7] != "none" else None
+        }
+        return result
+    elif len(parts) == 6:
+        # Old format: floating;dock_area;x;y;width;height
+        result = {
+            'floating': parts[0] == "True",
+            'dock_area': parts[1],
+            'x': int(parts[2]),
+            'y': int(parts[3]),
+            'width': int(parts[4]),
+            'height': int(parts[5]),
+            'relative_above': None,
+            'relative_below': None
+        }
+        return result
+    elif len(parts) == 5:
+        # Very old format: floating;x;y;width;height (no dock_area)
+        result = {
+            'floating': parts[0] == "True",
+            'dock_area': "none",
+            'x': int(parts[1]),
+            'y': int(parts[2]),
+            'width': int(parts[3]),
+            'height': int(parts[4]),
+            'relative_above': None,
+            'relative_below': None
+        }
+        return result
+    else:
+        return None
+
+
+# MaxScript returning every layer's name, parent name ("" for root), hidden and current flags
+# and the layer itself as five parallel arrays - populate_layers crosses into pymxs once
+# instead of per layer/property
+_LAYER_RECORDS_FN = """
+fn eskiGetLayerRecords = (
+    local names = #()
+    local parents = #()
+    local hidden = #()
+    local current = #()
+    local layers = #()
+    for i = 0 to LayerManager.count - 1 do (
+        local layer = LayerManager.getLayer i
+        local parentLayer = layer.getParent()
+        append names layer.name
+        append parents (if parentLayer == undefined then "" else parentLayer.name)
+        append hidden layer.ishidden
+        append current layer.current
+        append layers layer
+    )
+    #(names, parents, hidden, current, layers)
+)
+"""
+
+# MaxScript adding the current selection to a layer in one undoable call - parsed once, then
+# called with the layer name (no per-click script compile or name escaping)
+_ADD_SELECTION_FN = """
+fn eskiAddSelectionToLayer layerName quietMode = (
+    local targetLayer = layerManager.getLayerFromName layerName
+    if targetLayer != undefined do (
+        with undo "Add Selection to Layer" on (
+            with quiet quietMode (
+                for obj in selection do targetLayer.addNode obj
+            )
+        )
+    )
+)
+"""
+
+# MaxScript testing whether a layer sits anywhere below the named layer - the getParent()
+# walk runs inside 3ds Max in one call instead of two bridge calls per ancestor
+_IS_DESCENDANT_FN = """
+fn eskiIsDescendantOf lyr ancestorName = (
+    local found = false
+    local p = lyr.getParent()
+    while not found and p != undefined do (
+        found = p.name == ancestorName
+        p = p.getParent()
+    )
+    found
+)
+"""
+
+# MaxScript returning the distinct layer names of the selected objects - the 500ms sync poll
+# reads them in one call instead of two bridge calls (obj.layer, .name) per selected object
+_SELECTION_LAYERS_FN = """
+fn eskiGetSelectionLayerNames = (
+    local names = #()
+    for obj in selection where obj.layer != undefined do appendIfUnique names obj.layer.name
+    names
+)
+"""
+
+
+# MaxScript callback functions - each event calls straight into the imported module
+# (a direct call, not a python.Execute string compiled and run per event)
+_CALLBACK_FNS = """
+global EskiLayerManagerPy = python.Import "eski_layer_manager"
+
+-- Set by the first layer event, cleared by populate_layers - a burst of layer events
+-- (e.g. moving many nodes to a layer) enters Python once instead of once per event
+global EskiLayerManagerPending = false
+
+global EskiLayerManagerCallback
+fn EskiLayerManagerCallback = (
+    if not EskiLayerManagerPending do (
+        EskiLayerManagerPending = true
+        EskiLayerManagerPy.refresh_from_callback()
+    )
+)
+
+global EskiLayerManagerCurrentCallback
+fn EskiLayerManagerCurrentCallback = (
+    EskiLayerManagerPy.sync_current_layer()
+)
+
+global EskiLayerManagerSceneCallback
+fn EskiLayerManagerSceneCallback = (
+    EskiLayerManagerPy.refresh_on_scene_change()
+)
+
+global EskiLayerManagerSelectionCallback
+fn EskiLayerManagerSelectionCallback = (
+    EskiLayerManagerPy.update_selection_from_callback()
+)
+"""
+
+# Event registrations under the callback ids above - closeEvent removes them, a reopen re-runs this
+_CALLBACK_REGISTRATIONS = """
+-- Drop any registrations left over from a previous instance
+-- (and reopen the layer-event gate - closeEvent may have run before a refresh cleared it)
+EskiLayerManagerPending = false
+callbacks.removeScripts id:#EskiLayerManagerCallback
+callbacks.removeScripts id:#EskiLayerManagerCurrentCallback
+callbacks.removeScripts id:#EskiLayerManagerSceneCallback
+callbacks.removeScripts id:#EskiLayerManagerSelectionCallback
+
+-- Layer-related events (use regular refresh)
+callbacks.addScript #layerCreated "EskiLayerManagerCallback()" id:#EskiLayerManagerCallback
+callbacks.addScript #layerDeleted "EskiLayerManagerCallback()" id:#EskiLayerManagerCallback
+callbacks.addScript #nodeLayerChanged "EskiLayerManagerCallback()" id:#EskiLayerManagerCallback
+callbacks.addScript #layerParentChanged "EskiLayerManagerCallback()" id:#EskiLayerManagerCallback
+
+-- Current layer changes (just update selection, no full refresh)
+-- Some Max versions might use different callback names - rely on UI clicks instead
+try (callbacks.addScript #layerCurrent "EskiLayerManagerCurrentCallback()" id:#EskiLayerManagerCurrentCallback) catch ()
+
+-- Scene events (use scene refresh - reopen window)
+-- Note: postMerge callback not supported in 3ds Max 2026
+callbacks.addScript #filePostOpen "EskiLayerManagerSceneCallback()" id:#EskiLayerManagerSceneCallback
+callbacks.addScript #systemPostReset "EskiLayerManagerSceneCallback()" id:#EskiLayerManagerSceneCallback
+callbacks.addScript #systemPostNew "EskiLayerManagerSceneCallback()" id:#EskiLayerManagerSceneCallback
+
+-- Selection changes (update green dot indicators)
+callbacks.addScript #selectionSetChanged "EskiLayerManagerSelectionCallback()" id:#EskiLayerManagerSelectionCallback
+"""
 
 
 class InlineIconDelegate(QtWidgets.QStyledItemDelegate):
@@ -57,6 +276,105 @@ class InlineIconDelegate(QtWidgets.QStyledItemDelegate):
         self.icon_spacing = 3
         self.plus_icon_size = 14  # Match main icon size for consistency
         self.plus_icon_spacing = 3  # Compact spacing
+        # Slot widths from the row's left edge - fixed by the sizes above, so computed once
+        self._vis_width = self.icon_size + self.icon_spacing
+        self._add_width = self.plus_icon_spacing + self.plus_icon_size + self.icon_spacing
+        # Green selection dot on the right of layer rows - names are elided short of its slot
+        self.dot_size = 6
+        self.dot_margin = 8  # Distance from right edge
+        self._dot_width = self.icon_spacing + self.dot_size + self.dot_margin
+        # Fonts for the text fallback icons - created on first paint (needs the view's font family)
+        self._font_vis = None
+        self._font_plus = None
+        # Rasterized icons {(icon cacheKey, size): QPixmap} - QIcon.paint re-rasterizes every call
+        self._pixmap_cache = {}
+        # Shaped fallback glyphs {(text, point size): QStaticText} - drawText re-shapes every call
+        self._static_texts = {}
+        # Palette brushes/text color, refreshed when the palette's cacheKey changes (theme change)
+        self._palette_key = None
+        self._brush_base = None
+        self._brush_alt = None
+        self._text_color = None
+
+    def _sync_palette(self, palette):
+        """Cache the palette brushes and text color used by paint"""
+        self._palette_key = palette.cacheKey()
+        self._brush_base = palette.base()
+        self._brush_alt = palette.alternateBase()
+        self._text_color = palette.text().color()
+
+    def click_regions(self, index, rect, tree_widget):
+        """
+        Compute the visibility / add selection / name slots of a row (viewport coordinates)
+        Derived from the row rect on demand, so no hit-test state is stored per item
+        """
+        x = rect.left()
+        y = rect.top()
+        h = rect.height()
+        regions = {}
+
+        if index.data(QtCore.Qt.UserRole + 1):
+            regions['visibility'] = QtCore.QRect(x, y, self._vis_width, h)
+            x += self._vis_width
+
+        # Add selection icon only on layer rows, with extra spacing before it
+        if tree_widget is self.layer_manager.layer_tree:
+            regions['add_selection'] = QtCore.QRect(x + self.plus_icon_spacing, y, self.plus_icon_size, h)
+            x += self._add_width
+
+        # Full clickable area for the name
+        regions['name'] = QtCore.QRect(x, y, rect.right() - x, h)
+        return regions
+
+    def hit_region(self, index, rect, tree_widget, pos):
+        """
+        Name of the click_regions slot containing pos ('visibility', 'add_selection',
+        'name' or None) - same layout, plain int compares instead of building QRects
+        """
+        if not rect.top() <= pos.y() <= rect.bottom():
+            return None
+        px = pos.x()
+        x = rect.left()
+
+        if index.data(QtCore.Qt.UserRole + 1):
+            if x <= px < x + self._vis_width:
+                return 'visibility'
+            x += self._vis_width
+
+        if tree_widget is self.layer_manager.layer_tree:
+            add_x = x + self.plus_icon_spacing
+            if add_x <= px < add_x + self.plus_icon_size:
+                return 'add_selection'
+            x += self._add_width
+
+        if x <= px < rect.right():
+            return 'name'
+        return None
+
+    def _draw_glyph(self, painter, text, font, rect):
+        """Draw a Unicode fallback icon left-aligned and vertically centered in rect (cached QStaticText)"""
+        key = (text, font.pointSize())
+        static_text = self._static_texts.get(key)
+        if static_text is None:
+            static_text = QtGui.QStaticText(text)
+            static_text.setTextFormat(QtCore.Qt.PlainText)
+            static_text.setPerformanceHint(QtGui.QStaticText.AggressiveCaching)
+            static_text.prepare(QtGui.QTransform(), font)
+            self._static_texts[key] = static_text
+        painter.setFont(font)
+        top = rect.top() + (rect.height() - static_text.size().height()) / 2
+        painter.drawStaticText(QtCore.QPointF(rect.left(), top), static_text)
+
+    def _draw_icon(self, painter, icon, rect):
+        """Draw icon left-aligned and vertically centered in rect from a cached pixmap"""
+        size = min(rect.width(), rect.height())
+        key = (icon.cacheKey(), size)
+        pixmap = self._pixmap_cache.get(key)
+        if pixmap is None:
+            pixmap = icon.pixmap(size, size)
+            self._pixmap_cache[key] = pixmap
+        pixmap_height = int(pixmap.deviceIndependentSize().height())
+        painter.drawPixmap(rect.left(), rect.top() + (rect.height() - pixmap_height) // 2, pixmap)
 
     def _get_visual_row_number(self, index, tree_widget):
         """Calculate the visual row number by counting all visible rows from top"""
@@ -93,141 +411,119 @@ class InlineIconDelegate(QtWidgets.QStyledItemDelegate):
         return count
 
     def paint(self, painter, option, index):
-        """Custom paint method for rendering inline icons"""
-        painter.save()
-
-        # Determine which tree widget this index belongs to
-        item = self.layer_manager.layer_tree.itemFromIndex(index)
-        if item:
-            tree_widget = self.layer_manager.layer_tree
-        else:
-            item = self.layer_manager.objects_tree.itemFromIndex(index)
-            tree_widget = self.layer_manager.objects_tree
+        """Custom paint method for rendering inline icons (reads index data, no item lookup)"""
+        # The view being painted - the delegate is shared by the layer and objects trees
+        tree_widget = option.widget
+        if tree_widget is None:
+            return
 
-        if not item:
-            painter.restore()
+        # Skip rows outside the viewport (large repaints can hand us off-screen rows)
+        if option.rect.bottom() < 0 or option.rect.top() > tree_widget.viewport().height():
             return
 
-        # Calculate visual row number (counting all visible rows from top)
-        visual_row = self._get_visual_row_number(index, tree_widget)
+        painter.save()
+
+        if option.palette.cacheKey() != self._palette_key:
+            self._sync_palette(option.palette)
 
         # Check if this item is being hovered
-        # Safely check if hovered item is still valid (not deleted)
-        is_hovered = False
-        if hasattr(tree_widget, '_hovered_item') and tree_widget._hovered_item is not None:
-            try:
-                # Try to access the item - will raise RuntimeError if deleted
-                is_hovered = (tree_widget._hovered_item == item)
-            except RuntimeError:
-                # Item was deleted, clear the reference
-                tree_widget._hovered_item = None
+        # (persistent index - becomes invalid instead of dangling when the row is deleted)
+        is_hovered = tree_widget._hovered_index == index
 
         # Check if item has custom background (e.g., drag highlight)
-        custom_bg = item.background(0)
-        if custom_bg.color().alpha() > 0:
+        custom_bg = index.data(QtCore.Qt.BackgroundRole)
+        if custom_bg is None:
+            pass  # No background set - the default (NoBrush) brush paints nothing
+        elif custom_bg.color().alpha() > 0:
             # Use custom background (drag highlight)
             painter.fillRect(option.rect, custom_bg)
         else:
+            # Calculate visual row number (counting all visible rows from top)
+            visual_row = self._get_visual_row_number(index, tree_widget)
+
             # Draw background (alternating rows) - NO full row selection highlight
             # NOTE: Hover highlight will be drawn LATER, after active layer highlight
             if visual_row % 2:
-                painter.fillRect(option.rect, option.palette.alternateBase())
+                painter.fillRect(option.rect, self._brush_alt)
             else:
-                painter.fillRect(option.rect, option.palette.base())
+                painter.fillRect(option.rect, self._brush_base)
 
-        # Starting X position - use the visual rect which accounts for indentation
-        # option.rect gives us the item's visual rect in viewport coordinates
-        x = option.rect.left()
+        # Slot rects from the visual rect (accounts for indentation, viewport coordinates)
+        # Mouse handlers compute the same regions from visualRect, so nothing is stored on the item
+        regions = self.click_regions(index, option.rect, tree_widget)
         y = option.rect.top()
         h = option.rect.height()
 
-        # Store click regions for later detection (in viewport coordinates)
-        if not hasattr(item, 'click_regions'):
-            item.click_regions = {}
-
-        # Store the current item rect Y position for coordinate reference (store value, not QRect object)
-        item.current_item_y = option.rect.y()
-
         # Check if this item is selected (active layer) - draw highlight EARLY, before everything
         is_selected = option.state & QtWidgets.QStyle.State_Selected
         if is_selected:
             # Draw active layer highlight UNDER everything (after background, before icons/text)
             # This ensures the text remains readable and not affected by transparency
             # Full row highlight from left edge to right edge
-            highlight_rect = QtCore.QRect(option.rect.left(), y, option.rect.width(), h)
             highlight_color = QtGui.QColor(0, 100, 100, 120)  # Darker teal with alpha
-            painter.fillRect(highlight_rect, highlight_color)
+            painter.fillRect(option.rect, highlight_color)
 
         # Draw hover highlight AFTER active layer highlight (so it shows on top)
         if is_hovered:
             # Draw hover overlay on top of everything so far
-            hover_rect = QtCore.QRect(option.rect.left(), y, option.rect.width(), h)
             hover_color = QtGui.QColor(0, 140, 140, 80)  # Brighter teal with lower alpha so it layers nicely
-            painter.fillRect(hover_rect, hover_color)
+            painter.fillRect(option.rect, hover_color)
 
-        # Skip drawing custom arrow - Qt's built-in tree arrows are sufficient
-        # (We still store arrow data in UserRole but don't paint it)
+        # Skip drawing custom arrow - drawBranches handles expand/collapse arrows
+
+        # Text fallback fonts, built once from the view's font family
+        if self._font_vis is None:
+            family = painter.font().family()
+            self._font_vis = QtGui.QFont(family, 10)
+            self._font_plus = QtGui.QFont(family, 12)
 
         # 1. Draw visibility icon (👁/✖/🔒)
-        vis_icon = item.data(0, QtCore.Qt.UserRole + 1)  # Store visibility icon
+        vis_icon = index.data(QtCore.Qt.UserRole + 1)  # Store visibility icon
         if vis_icon:
-            # Create rect in viewport coordinates
-            vis_rect = QtCore.QRect(x, y, self.icon_size + self.icon_spacing, h)
-            item.click_regions['visibility'] = vis_rect
+            vis_rect = regions['visibility']
 
             if isinstance(vis_icon, QtGui.QIcon):
-                vis_icon.paint(painter, vis_rect, QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter)
+                self._draw_icon(painter, vis_icon, vis_rect)
             else:
-                painter.setFont(QtGui.QFont(painter.font().family(), 10))
-                painter.drawText(vis_rect, QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter, str(vis_icon))
-            x += self.icon_size + self.icon_spacing
+                self._draw_glyph(painter, str(vis_icon), self._font_vis, vis_rect)
 
         # 2. Draw add selection icon (+) - bigger and with extra spacing
-        add_icon = item.data(0, QtCore.Qt.UserRole + 2)  # Store add icon
+        # Same icon on every layer row, so it's a delegate default rather than per-item data
+        add_icon = None
+        if tree_widget is self.layer_manager.layer_tree:
+            add_icon = self.layer_manager.icon_add_selection or "+"
         if add_icon:
-            # Add extra spacing before the plus icon
-            x += self.plus_icon_spacing
-
-            # Create rect in viewport coordinates (bigger rect for plus icon)
-            add_rect = QtCore.QRect(x, y, self.plus_icon_size, h)
-            item.click_regions['add_selection'] = add_rect
+            add_rect = regions['add_selection']
 
             if isinstance(add_icon, QtGui.QIcon):
-                add_icon.paint(painter, add_rect, QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter)
+                self._draw_icon(painter, add_icon, add_rect)
             else:
                 # Bigger font for plus icon
-                painter.setFont(QtGui.QFont(painter.font().family(), 12))
-                painter.drawText(add_rect, QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter, str(add_icon))
-            x += self.plus_icon_size + self.icon_spacing
+                self._draw_glyph(painter, str(add_icon), self._font_plus, add_rect)
 
         # 3. Draw layer name
-        layer_name = item.text(0)
+        layer_name = index.data(QtCore.Qt.DisplayRole)
 
-        # Calculate text width
-        font_metrics = QtGui.QFontMetrics(option.font)
-        text_width = font_metrics.horizontalAdvance(layer_name)
+        name_rect = regions['name']
+        is_layer_row = tree_widget is self.layer_manager.layer_tree
 
-        # Create rects for rendering and click detection
-        name_rect = QtCore.QRect(x, y, option.rect.right() - x, h)  # Full clickable area
-        item.click_regions['name'] = name_rect
+        # Keep the green dot's slot free on layer rows so long names never run under it
+        text_rect = name_rect.adjusted(0, 0, -self._dot_width, 0) if is_layer_row else name_rect
+        text = option.fontMetrics.elidedText(layer_name, QtCore.Qt.ElideRight, text_rect.width())
 
         # Set text color (same for all layers)
-        painter.setPen(option.palette.text().color())
+        painter.setPen(self._text_color)
 
         painter.setFont(option.font)
-        # Draw text at the same position
-        text_rect = QtCore.QRect(x, y, text_width + 12, h)
-        painter.drawText(text_rect, QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter, layer_name)
+        painter.drawText(text_rect, QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter, text)
 
         # 4. Draw green dot indicator if layer contains selected objects (right-aligned)
         # Only draw in layer tree, not objects tree
-        if tree_widget == self.layer_manager.layer_tree and layer_name in self.layer_manager.layers_with_selection:
-            # Green dot size
-            dot_size = 6
-            dot_margin = 8  # Distance from right edge
+        if is_layer_row and layer_name in self.layer_manager.layers_with_selection:
+            dot_size = self.dot_size
 
             # Position on the right side
-            dot_x = option.rect.right() - dot_margin - dot_size
+            dot_x = option.rect.right() - self.dot_margin - dot_size
             dot_y = y + (h - dot_size) // 2  # Center vertically
 
             # Draw green circle
@@ -256,18 +552,15 @@ class InlineIconDelegate(QtWidgets.QStyledItemDelegate):
         # Calculate X offset to match where layer name is painted
         x_offset = 0
 
-        # Get the item to check for icons
-        item = self.layer_manager.layer_tree.itemFromIndex(index)
-        if item:
+        # Only layer rows are editable - check the index data for icons
+        if option.widget is self.layer_manager.layer_tree:
             # Add offset for visibility icon if present
-            vis_icon = item.data(0, QtCore.Qt.UserRole + 1)
+            vis_icon = index.data(QtCore.Qt.UserRole + 1)
             if vis_icon:
-                x_offset += self.icon_size + self.icon_spacing
+                x_offset += self._vis_width
 
-            # Add offset for add selection icon if present
-            add_icon = item.data(0, QtCore.Qt.UserRole + 2)
-            if add_icon:
-                x_offset += self.plus_icon_spacing + self.plus_icon_size + self.icon_spacing
+            # Add offset for add selection icon (always painted on layer rows)
+            x_offset += self._add_width
 
         # Position editor at the calculated offset
         editor_rect = QtCore.QRect(
@@ -294,11 +587,96 @@ class CustomTreeWidget(QtWidgets.QTreeWidget):
 
         # Track hovered item for hover highlighting
         self._hovered_item = None
+        self._hovered_index = QtCore.QPersistentModelIndex()  # Same row, for the delegate's paint
 
         # Enable mouse tracking to get mouseMoveEvent without button press
         self.setMouseTracking(True)
         self.viewport().setMouseTracking(True)
 
+        # Expand/collapse arrow font for drawBranches (rebuilt on font change)
+        self._cache_arrow_font()
+
+        # Per-depth x positions for drawBranches (rebuilt by setIndentation)
+        self._cache_indent_tables()
+
+        # Collapsed branches get their sibling flags when first expanded
+        self.itemExpanded.connect(self._cache_expanded_children)
+
+    def setIndentation(self, indentation):
+        """Set the indentation and rebuild the per-depth x position tables"""
+        super(CustomTreeWidget, self).setIndentation(indentation)
+        self._cache_indent_tables()
+
+    def _cache_indent_tables(self, max_depth=64):
+        """Precompute drawBranches x positions indexed by depth (indentation is fixed per tree)"""
+        indent = self.indentation()
+        depths = range(max_depth + 1)
+        self._guide_x = tuple(d * indent + indent // 2 for d in depths)  # Vertical guide line for level d
+        self._branch_end_x = tuple(d * indent + 2 for d in depths)  # Connector end before an arrow
+        self._leaf_end_x = tuple(d * indent + 16 for d in depths)  # Connector end near the eye icon
+        self._arrow_x = tuple(d * indent + 4 for d in depths)
+
+    def _cache_arrow_font(self):
+        """Build the arrow font, its ascent and the shaped arrow glyphs once instead of per drawBranches call"""
+        self._arrow_font = self.font()
+        self._arrow_font.setPointSize(20)
+        self._arrow_ascent = QtGui.QFontMetrics(self._arrow_font).ascent()
+
+        # {expanded: QStaticText} - down arrow (▾) when expanded, right arrow (▸) when collapsed
+        self._arrow_texts = {}
+        for expanded, arrow_text in ((True, "▾"), (False, "▸")):
+            static_text = QtGui.QStaticText(arrow_text)
+            static_text.setTextFormat(QtCore.Qt.PlainText)
+            static_text.setPerformanceHint(QtGui.QStaticText.AggressiveCaching)
+            static_text.prepare(QtGui.QTransform(), self._arrow_font)
+            self._arrow_texts[expanded] = static_text
+
+    def cache_sibling_flags(self):
+        """
+        Store branch-drawing data on every visible item for drawBranches:
+        UserRole+10: "has sibling below" flag
+        UserRole+11: the ancestors' flags, nearest parent first (its length is the depth)
+        Call after populate_layers changes the items - collapsed branches are
+        skipped and marked by _cache_expanded_children when first shown
+        """
+        self._mark_sibling_flags(self.invisibleRootItem(), ())
+
+    def _mark_sibling_flags(self, parent_item, ancestor_flags):
+        """Store sibling flags on parent_item's children, descending into expanded ones only"""
+        last = parent_item.childCount() - 1
+        for i in range(last + 1):
+            item = parent_item.child(i)
+            has_below = i < last
+            item.setData(0, QtCore.Qt.UserRole + 10, has_below)
+            item.setData(0, QtCore.Qt.UserRole + 11, ancestor_flags)
+            if item.isExpanded():
+                self._mark_sibling_flags(item, (has_below,) + ancestor_flags)
+
+    def _cache_expanded_children(self, item):
+        """Mark a branch's children when it is expanded (skipped by cache_sibling_flags while collapsed)"""
+        ancestor_flags = item.data(0, QtCore.Qt.UserRole + 11)
+        if ancestor_flags is None:
+            # Item itself never marked - leave the subtree to drawBranches' fallback
+            return
+        self._mark_sibling_flags(item, (self._has_sibling_below(item),) + ancestor_flags)
+
+    def _has_sibling_below(self, item):
+        """Cached "has sibling below" flag, computed directly for uncached items"""
+        has_below = item.data(0, QtCore.Qt.UserRole + 10)
+        if has_below is None:
+            parent = item.parent()
+            if parent:
+                has_below = parent.indexOfChild(item) < parent.childCount() - 1
+            else:
+                has_below = self.indexOfTopLevelItem(item) < self.topLevelItemCount() - 1
+        return has_below
+
+    def changeEvent(self, event):
+        """Refresh the cached arrow font when the widget font changes"""
+        if event.type() == QtCore.QEvent.FontChange:
+            self._cache_arrow_font()
+        super(CustomTreeWidget, self).changeEvent(event)
+
     def mousePressEvent(self, event):
         """Intercept mouse press - suppress default selection when clicking on icons.
         Icon clicks fire itemClicked in mouseReleaseEvent (standard Qt click semantics)."""
@@ -308,23 +686,11 @@ class CustomTreeWidget(QtWidgets.QTreeWidget):
             return
 
         cursor_pos = event.pos()
-        index = self.indexAt(event.pos())
-        visual_rect = self.visualRect(index)
-
-        if hasattr(item, 'click_regions') and hasattr(item, 'current_item_y'):
-            y_offset = visual_rect.y() - item.current_item_y
-
-            if 'visibility' in item.click_regions:
-                vis_rect = item.click_regions['visibility'].translated(0, y_offset)
-                if vis_rect.contains(cursor_pos):
-                    event.accept()
-                    return
-
-            if 'add_selection' in item.click_regions:
-                add_rect = item.click_regions['add_selection'].translated(0, y_offset)
-                if add_rect.contains(cursor_pos):
-                    event.accept()
-                    return
+        index = self.indexAt(cursor_pos)
+        region = self.itemDelegate().hit_region(index, self.visualRect(index), self, cursor_pos)
+        if region in ('visibility', 'add_selection'):
+            event.accept()
+            return
 
         super(CustomTreeWidget, self).mousePressEvent(event)
 
@@ -338,25 +704,12 @@ class CustomTreeWidget(QtWidgets.QTreeWidget):
             return
 
         cursor_pos = event.pos()
-        index = self.indexAt(event.pos())
-        visual_rect = self.visualRect(index)
-
-        if hasattr(item, 'click_regions') and hasattr(item, 'current_item_y'):
-            y_offset = visual_rect.y() - item.current_item_y
-
-            if 'visibility' in item.click_regions:
-                vis_rect = item.click_regions['visibility'].translated(0, y_offset)
-                if vis_rect.contains(cursor_pos):
-                    event.accept()
-                    self.itemClicked.emit(item, 0)
-                    return
-
-            if 'add_selection' in item.click_regions:
-                add_rect = item.click_regions['add_selection'].translated(0, y_offset)
-                if add_rect.contains(cursor_pos):
-                    event.accept()
-                    self.itemClicked.emit(item, 0)
-                    return
+        index = self.indexAt(cursor_pos)
+        region = self.itemDelegate().hit_region(index, self.visualRect(index), self, cursor_pos)
+        if region in ('visibility', 'add_selection'):
+            event.accept()
+            self.itemClicked.emit(item, 0)
+            return
 
         super(CustomTreeWidget, self).mouseReleaseEvent(event)
 
@@ -368,24 +721,20 @@ class CustomTreeWidget(QtWidgets.QTreeWidget):
         if item != self._hovered_item:
             old_hovered = self._hovered_item
             self._hovered_item = item
+            self._hovered_index = QtCore.QPersistentModelIndex(self.indexAt(event.pos()) if item else QtCore.QModelIndex())
 
             # Repaint old hovered item (if still valid)
             if old_hovered:
                 try:
-                    index = self.indexFromItem(old_hovered)
-                    if index.isValid():
-                        rect = self.visualRect(index)
-                        self.viewport().update(rect)
+                    # (empty rect if the item left the tree - update() ignores it)
+                    self.viewport().update(self.visualItemRect(old_hovered))
                 except RuntimeError:
                     # Old item was deleted, ignore
                     pass
 
             # Repaint new hovered item
             if self._hovered_item:
-                index = self.indexFromItem(self._hovered_item)
-                if index.isValid():
-                    rect = self.visualRect(index)
-                    self.viewport().update(rect)
+                self.viewport().update(self.visualItemRect(self._hovered_item))
 
         # Call parent implementation
         super(CustomTreeWidget, self).mouseMoveEvent(event)
@@ -395,13 +744,11 @@ class CustomTreeWidget(QtWidgets.QTreeWidget):
         if self._hovered_item:
             old_hovered = self._hovered_item
             self._hovered_item = None
+            self._hovered_index = QtCore.QPersistentModelIndex()
 
             # Repaint the item that was hovered (if still valid)
             try:
-                index = self.indexFromItem(old_hovered)
-                if index.isValid():
-                    rect = self.visualRect(index)
-                    self.viewport().update(rect)
+                self.viewport().update(self.visualItemRect(old_hovered))
             except RuntimeError:
                 # Item was already deleted, ignore
                 pass
@@ -436,10 +783,7 @@ class CustomTreeWidget(QtWidgets.QTreeWidget):
             # Use a bright teal+green highlight color for maximum visibility
             item.setBackground(0, QtGui.QColor(0, 220, 180, 200))  # Bright teal-green with high alpha
             # Only repaint the specific item rect for better performance
-            index = self.indexFromItem(item)
-            if index.isValid():
-                rect = self.visualRect(index)
-                self.viewport().update(rect)
+            self.viewport().update(self.visualItemRect(item))
 
     def _clear_drag_highlight(self, item):
         """Clear visual highlight from item"""
@@ -447,10 +791,7 @@ class CustomTreeWidget(QtWidgets.QTreeWidget):
             # Reset to transparent (let alternating row colors show through)
             item.setBackground(0, QtGui.QColor(0, 0, 0, 0))
             # Only repaint the specific item rect for better performance
-            index = self.indexFromItem(item)
-            if index.isValid():
-                rect = self.visualRect(index)
-                self.viewport().update(rect)
+            self.viewport().update(self.visualItemRect(item))
 
     def dragLeaveEvent(self, event):
         """Clear highlight when drag leaves the widget"""
@@ -571,12 +912,20 @@ class CustomTreeWidget(QtWidgets.QTreeWidget):
         """Override to draw custom tree lines, horizontal connectors, and expand/collapse arrows"""
         painter.save()
 
-        indent = self.indentation()
-        depth = 0
-        parent_idx = index.parent()
-        while parent_idx.isValid():
-            depth += 1
-            parent_idx = parent_idx.parent()
+        # Ancestors' "has sibling below" flags (nearest parent first) - cached at populate time
+        ancestor_flags = index.data(QtCore.Qt.UserRole + 11)
+        if ancestor_flags is None:
+            # Uncached item - walk the parent chain
+            ancestor_flags = []
+            parent_item = self.itemFromIndex(index).parent()
+            while parent_item is not None:
+                ancestor_flags.append(self._has_sibling_below(parent_item))
+                parent_item = parent_item.parent()
+        depth = len(ancestor_flags)
+        if depth >= len(self._arrow_x):
+            # Deeper than the precomputed tables - grow them
+            self._cache_indent_tables(depth * 2)
+        has_children = self.model().hasChildren(index)
 
         # Center Y position for horizontal line
         center_y = rect.y() + rect.height() // 2
@@ -587,64 +936,41 @@ class CustomTreeWidget(QtWidgets.QTreeWidget):
         painter.setPen(pen)
 
         # Draw vertical lines for each parent level
-        temp_parent = index.parent()
         temp_depth = depth - 1
-        while temp_parent.isValid():
-            # Check if this parent has more siblings below
-            parent_of_parent = temp_parent.parent()
-            if parent_of_parent.isValid():
-                row = temp_parent.row()
-                sibling_count = self.model().rowCount(parent_of_parent)
-                if row < sibling_count - 1:  # Has siblings below
-                    x = temp_depth * indent + indent // 2
-                    painter.drawLine(x, rect.y(), x, rect.y() + rect.height())
-            elif temp_parent.row() < self.model().rowCount(QtCore.QModelIndex()) - 1:
-                # Root level with siblings below
-                x = temp_depth * indent + indent // 2
+        for has_sibling_below in ancestor_flags:
+            # Check if this parent has more siblings below (cached flag, no rowCount calls)
+            if has_sibling_below:
+                x = self._guide_x[temp_depth]
                 painter.drawLine(x, rect.y(), x, rect.y() + rect.height())
 
             temp_depth -= 1
-            temp_parent = temp_parent.parent()
 
         # Draw horizontal line to this item (centered vertically)
         if depth > 0:
-            x_start = (depth - 1) * indent + indent // 2
+            x_start = self._guide_x[depth - 1]
             # Extend line further if no children (no arrow takes up space)
-            if self.model().hasChildren(index):
-                x_end = depth * indent + 2
+            if has_children:
+                x_end = self._branch_end_x[depth]
             else:
-                x_end = depth * indent + 16  # Extend to reach near the eye icon
+                x_end = self._leaf_end_x[depth]  # Extend to reach near the eye icon
             painter.drawLine(x_start, center_y, x_end, center_y)
 
             # Draw vertical line from top to center for this item
-            x = (depth - 1) * indent + indent // 2
-
-            # Check if this item has siblings below
-            if index.parent().isValid():
-                row = index.row()
-                sibling_count = self.model().rowCount(index.parent())
-                if row < sibling_count - 1:  # Has siblings below
-                    painter.drawLine(x, rect.y(), x, center_y)
-                else:  # Last child
-                    painter.drawLine(x, rect.y(), x, center_y)
-            else:
-                # Root level
-                row = index.row()
-                sibling_count = self.model().rowCount(QtCore.QModelIndex())
-                if row < sibling_count - 1:
-                    painter.drawLine(x, rect.y(), x, center_y)
-                else:
-                    painter.drawLine(x, rect.y(), x, center_y)
+            x = x_start
+
+            # Same line for middle and last children - the parent-level loop above
+            # continues it below the row when there are siblings below
+            painter.drawLine(x, rect.y(), x, center_y)
         else:
             # Root level (depth == 0) - draw horizontal line from left edge
-            x_start = indent // 2
-            x_end = indent + 2
+            x_start = self._guide_x[0]
+            x_end = self._branch_end_x[1]
             painter.drawLine(x_start, center_y, x_end, center_y)
 
             # Draw vertical line for root level connection
-            x = indent // 2
+            x = x_start
             row = index.row()
-            sibling_count = self.model().rowCount(QtCore.QModelIndex())
+            sibling_count = self.topLevelItemCount()
 
             if row == 0 and sibling_count > 1:
                 # First root item - draw from center down
@@ -657,29 +983,22 @@ class CustomTreeWidget(QtWidgets.QTreeWidget):
                 painter.drawLine(x, rect.y(), x, rect.y() + rect.height())
 
         # Draw expand/collapse arrow if this item has children
-        if self.model().hasChildren(index):
+        if has_children:
             arrow_y = center_y
 
             # Set font for arrow
-            font = self.font()
-            font.setPointSize(20)
-            painter.setFont(font)
-
-            if self.isExpanded(index):
-                # Draw down arrow (▾) - moved left 1 pixel
-                arrow_text = "▾"
-                arrow_x = depth * indent + 4
-            else:
-                # Draw right arrow (▸) - moved up 3 pixels
-                arrow_text = "▸"
-                arrow_x = depth * indent + 4
+            painter.setFont(self._arrow_font)
 
-            # Draw the arrow text centered
-            fm = QtGui.QFontMetrics(font)
-            text_width = fm.horizontalAdvance(arrow_text)
+            # Down arrow (▾) when expanded, right arrow (▸) when collapsed
+            expanded = self.isExpanded(index)
+            arrow_x = self._arrow_x[depth]
+
+            # Draw the arrow text centered (baseline at arrow_y + ascent/2)
             # Move right arrow up 3 pixels
-            y_offset = -3 if not self.isExpanded(index) else 0
-            painter.drawText(arrow_x, arrow_y + fm.ascent() // 2 + y_offset, arrow_text)
+            y_offset = 0 if expanded else -3
+            baseline_y = arrow_y + self._arrow_ascent // 2 + y_offset
+            # drawStaticText positions by top-left, so step back up by the ascent
+            painter.drawStaticText(arrow_x, baseline_y - self._arrow_ascent, self._arrow_texts[expanded])
 
         painter.restore()
 
@@ -697,7 +1016,8 @@ class EskiLayerManager(QtWidgets.QDockWidget):
 
         # Set window flags for proper integration with 3ds Max
         self.setWindowFlags(QtCore.Qt.Tool)
-        self.setAttribute(QtCore.Qt.WA_DeleteOnClose)
+        # Never delete on close - the single instance is hidden and reused (pool of one)
+        self.setAttribute(QtCore.Qt.WA_DeleteOnClose, False)
 
         # Allow the widget to float
         self.setFloating(False)
@@ -718,18 +1038,63 @@ class EskiLayerManager(QtWidgets.QDockWidget):
         # Track which layer is currently displayed in the objects tree
         self.current_objects_layer = None
 
-        # Track visibility states for sync detection {layer_name: is_hidden}
-        self.last_visibility_states = {}
-
         # Track layers that contain selected objects (for green dot indicator)
         self.layers_with_selection = set()
 
+        # Layer tree needs a rebuild (set by callbacks, cleared by populate_layers)
+        self._dirty = True
+
+        # (name, parent, hidden, current) per layer at the last tree build - unchanged means skip
+        self._layer_fingerprint = None
+
+        # {layer name: tree item} from the last populate_layers build
+        self._layer_items = {}
+
+        # {layer name: index into the last build's records} (for in-place state patches)
+        self._layer_rows = {}
+
+        # {layer name: 3ds Max layer} from the last populate_layers fetch (saves hierarchy scans)
+        self._layer_by_name = {}
+
+        # Debounced populate_layers for callbacks - each request restarts the 50ms wait,
+        # so a burst of 3ds Max events (scene import, scripted deletes) refreshes once
+        self._refresh_timer = QtCore.QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(50)
+        self._refresh_timer.timeout.connect(self.populate_layers)
+
+        # Deferred select_active_layer for the layerCurrent callback - repeated switches
+        # within one event loop turn select (and list objects for) the final layer once
+        self._select_active_timer = QtCore.QTimer(self)
+        self._select_active_timer.setSingleShot(True)
+        self._select_active_timer.setInterval(0)
+        self._select_active_timer.timeout.connect(self.select_active_layer)
+
+        # Batched MaxScript layer fetch (see _LAYER_RECORDS_FN), defined on first populate
+        self._get_layer_records = None
+
+        # MaxScript add-selection function (see _ADD_SELECTION_FN), defined on first use
+        self._add_selection_fn = None
+
+        # MaxScript ancestor check for reparenting (see _IS_DESCENDANT_FN), defined on first use
+        self._is_descendant_fn = None
+
+        # MaxScript selection-layers query (see _SELECTION_LAYERS_FN), defined on first poll
+        self._get_selection_layers = None
+
+        # Set by closeEvent - callbacks and timers are restarted on the next show
+        self._closed = False
+
+        # Bound show/raise_/activateWindow for the re-show path - kept on the instance, so the
+        # cache goes away with it (a module-level copy went stale across an upgrade reload)
+        self._front_calls = (self.show, self.raise_, self.activateWindow)
+
         # Track isolation state for undo functionality
         self.isolation_state = None  # Stores {layer_name: is_hidden} before isolation
         self.isolated_layer = None  # Name of currently isolated layer
 
-        # Load native 3ds Max icons for visibility and add selection
-        self.load_visibility_icons()
+        # Load native 3ds Max icon for add selection
+        # (Visibility icons are loaded lazily by the first real populate_layers)
         self.load_add_selection_icon()
 
         # Initialize UI
@@ -788,6 +1153,37 @@ class EskiLayerManager(QtWidgets.QDockWidget):
         self.status_label.setText(f"Eski Layer Manager v{VERSION}")
         QtCore.QTimer.singleShot(VERSION_DISPLAY_DURATION, self.start_tip_rotation)
 
+    @classmethod
+    def instance(cls, parent=None):
+        """
+        Return the live layer manager, creating it on first use (singleton factory)
+        The reference is kept in the module global, which survives re-running this script
+        (a class attribute would not - re-running redefines the class)
+        """
+        global _layer_manager_instance, _quit_hook_connected
+
+        instance = _layer_manager_instance
+        if type(instance) is cls and isValid(instance):
+            return instance
+        if instance is not None:
+            # Dead, or created by the class from before a module reload - replace it
+            _discard_instance(instance)
+
+        instance = cls(parent=parent)
+        _layer_manager_instance = instance
+
+        # Auto-null the reference when Qt destroys the widget (acts like a QPointer),
+        # and explicitly before Qt tears everything down on application exit
+        # (one module-level quit handler reading the current global - a per-instance
+        # lambda would keep every discarded or reloaded window alive until quit)
+        instance.destroyed.connect(lambda *args, inst=instance: _on_instance_destroyed(inst))
+        app = QtCore.QCoreApplication.instance()
+        if app is not None and not _quit_hook_connected:
+            app.aboutToQuit.connect(_on_about_to_quit)
+            _quit_hook_connected = True
+
+        return instance
+
     def load_visibility_icons(self):
         """Load native 3ds Max visibility icons using Qt resource system"""
         self.icon_visible = None
@@ -795,48 +1191,28 @@ class EskiLayerManager(QtWidgets.QDockWidget):
         self.icon_hidden_light = None  # Light version for inherited hidden state
         self.use_native_icons = False
 
-        # Try using qtmax.LoadMaxMultiResIcon first (official method)
+        # Try using qtmax.LoadMaxMultiResIcon first (official method, cached per path)
         # Priority order: StateSets > SceneExplorer > LayerExplorer
-        try:
-            import qtmax
-
-            # Try StateSets icons first (from icon resource guide)
-            icon_path_candidates = [
-                ("StateSets/Visible", "StateSets/Hidden"),
-                ("StateSets/visible", "StateSets/hidden"),
-                ("SceneExplorer/Visible", "SceneExplorer/Hidden"),
-                ("LayerExplorer/Visible", "LayerExplorer/Hidden"),
-            ]
+        icon_path_candidates = [
+            ("StateSets/Visible", "StateSets/Hidden"),
+            ("StateSets/visible", "StateSets/hidden"),
+            ("SceneExplorer/Visible", "SceneExplorer/Hidden"),
+            ("LayerExplorer/Visible", "LayerExplorer/Hidden"),
+        ]
 
-            for visible_path, hidden_path in icon_path_candidates:
-                try:
-                    visible_icon = qtmax.LoadMaxMultiResIcon(visible_path)
-                    hidden_icon = qtmax.LoadMaxMultiResIcon(hidden_path)
-
-                    if visible_icon and not visible_icon.isNull() and hidden_icon and not hidden_icon.isNull():
-                        # Check if icons have actual pixel data
-                        if len(visible_icon.availableSizes()) > 0 and len(hidden_icon.availableSizes()) > 0:
-                            self.icon_visible = visible_icon
-                            self.icon_hidden = hidden_icon
-
-                            # Try to load TreeView hidden icon for inherited hidden state
-                            try:
-                                hidden_light_icon = qtmax.LoadMaxMultiResIcon("TrackView/TreeView/Hidden")
-                                if hidden_light_icon and not hidden_light_icon.isNull():
-                                    if len(hidden_light_icon.availableSizes()) > 0:
-                                        self.icon_hidden_light = hidden_light_icon
-                            except:
-                                pass
-
-                            self.use_native_icons = True
-                            return
-                        else:
-                            pass  # Debug print removed
-                except Exception as e:
-                    pass  # Debug print removed
+        for visible_path, hidden_path in icon_path_candidates:
+            visible_icon = _load_max_icon(visible_path)
+            hidden_icon = _load_max_icon(hidden_path)
 
-        except Exception as e:
-            pass  # Debug print removed
+            if visible_icon and hidden_icon:
+                self.icon_visible = visible_icon
+                self.icon_hidden = hidden_icon
+
+                # Try to load TreeView hidden icon for inherited hidden state
+                self.icon_hidden_light = _load_max_icon("TrackView/TreeView/Hidden")
+
+                self.use_native_icons = True
+                return
 
         # Try Qt resource system paths
         icon_candidates = [
@@ -874,35 +1250,21 @@ class EskiLayerManager(QtWidgets.QDockWidget):
                         pass
 
                     self.use_native_icons = True
-                    pass  # Debug print removed
                     return
-                else:
-                    pass  # Debug print removed
 
-        # No native icons found - will use Unicode fallback
-        pass  # Debug print removed
+        # No native icons found - will use Unicode fallback (use_native_icons stays False)
 
     def load_add_selection_icon(self):
         """Load native 3ds Max icon for AddSelectionToCurrentLayer"""
         self.icon_add_selection = None
         self.use_native_add_icon = False
 
-        # Try using qtmax.LoadMaxMultiResIcon
-        try:
-            import qtmax
-            add_icon = qtmax.LoadMaxMultiResIcon("AddSelectionToCurrentLayer")
-
-            if add_icon and not add_icon.isNull():
-                # Check if icon has actual pixel data
-                if len(add_icon.availableSizes()) > 0:
-                    self.icon_add_selection = add_icon
-                    self.use_native_add_icon = True
-                    pass  # Debug print removed
-                    return
-                else:
-                    pass  # Debug print removed
-        except Exception as e:
-            pass  # Debug print removed
+        # Try using qtmax.LoadMaxMultiResIcon (cached per path)
+        add_icon = _load_max_icon("AddSelectionToCurrentLayer")
+        if add_icon:
+            self.icon_add_selection = add_icon
+            self.use_native_add_icon = True
+            return
 
         # Try Qt resource paths
         icon_candidates = [
@@ -916,11 +1278,9 @@ class EskiLayerManager(QtWidgets.QDockWidget):
             if not add_icon.isNull() and len(add_icon.availableSizes()) > 0:
                 self.icon_add_selection = add_icon
                 self.use_native_add_icon = True
-                pass  # Debug print removed
                 return
 
-        # No native icon found - will use Unicode fallback "+"
-        pass  # Debug print removed
+        # No native icon found - will use Unicode fallback "+" (use_native_add_icon stays False)
 
     def init_ui(self):
         """Initialize the user interface"""
@@ -989,6 +1349,8 @@ class EskiLayerManager(QtWidgets.QDockWidget):
         self.layer_tree.setIconSize(QtCore.QSize(14, 14))
 
         # Set uniform row heights for better icon display
+        # (also lets QTreeView lay out rows from one height instead of per-row sizeHint calls -
+        # its equivalent of QListView's batched layout mode, which QTreeView doesn't have)
         self.layer_tree.setUniformRowHeights(True)
 
         # Enable drag-and-drop for layer reparenting and object reassignment
@@ -1107,19 +1469,12 @@ class EskiLayerManager(QtWidgets.QDockWidget):
         refresh_btn.setFocusPolicy(QtCore.Qt.NoFocus)  # Don't capture keyboard focus
 
         # Try to load StateSets/Refresh icon
-        try:
-            if QTMAX_AVAILABLE:
-                import qtmax
-                refresh_icon = qtmax.LoadMaxMultiResIcon("StateSets/Refresh")
-                if refresh_icon and not refresh_icon.isNull():
-                    refresh_btn.setIcon(refresh_icon)
-                    refresh_btn.setIconSize(QtCore.QSize(24, 24))
-                else:
-                    # Fallback to text if icon not found
-                    refresh_btn.setText("R")
-            else:
-                refresh_btn.setText("R")
-        except:
+        refresh_icon = _load_max_icon("StateSets/Refresh")
+        if refresh_icon:
+            refresh_btn.setIcon(refresh_icon)
+            refresh_btn.setIconSize(QtCore.QSize(24, 24))
+        else:
+            # Fallback to text if icon not found
             refresh_btn.setText("R")
 
         button_layout.addWidget(refresh_btn)
@@ -1134,7 +1489,6 @@ class EskiLayerManager(QtWidgets.QDockWidget):
         # Try to load Layer icon - try multiple paths following StateSets pattern
         icon_loaded = False
         if QTMAX_AVAILABLE:
-            import qtmax
             # Try multiple icon paths for create new layer (following StateSets/Refresh pattern)
             icon_paths = [
                 "Layers/CreateNewLayer",
@@ -1148,16 +1502,12 @@ class EskiLayerManager(QtWidgets.QDockWidget):
                 "Ribbon/SceneExplorer/Layer_NewLayer"
             ]
             for icon_path in icon_paths:
-                try:
-                    create_icon = qtmax.LoadMaxMultiResIcon(icon_path)
-                    if create_icon and not create_icon.isNull():
-                        if len(create_icon.availableSizes()) > 0:
-                            create_layer_btn.setIcon(create_icon)
-                            create_layer_btn.setIconSize(QtCore.QSize(24, 24))
-                            icon_loaded = True
-                            break
-                except:
-                    continue
+                create_icon = _load_max_icon(icon_path)
+                if create_icon:
+                    create_layer_btn.setIcon(create_icon)
+                    create_layer_btn.setIconSize(QtCore.QSize(24, 24))
+                    icon_loaded = True
+                    break
 
         if not icon_loaded:
             create_layer_btn.setText("+")
@@ -1174,7 +1524,6 @@ class EskiLayerManager(QtWidgets.QDockWidget):
         # Try to load DeleteAnimLayer icon (correct path: animationLayer/DeleteAnimLayer)
         delete_icon_loaded = False
         if QTMAX_AVAILABLE:
-            import qtmax
             # Try the correct icon path first, then fallbacks
             delete_icon_paths = [
                 "animationLayer/DeleteAnimLayer",  # Correct path
@@ -1184,16 +1533,12 @@ class EskiLayerManager(QtWidgets.QDockWidget):
                 "AnimationLayers/DeleteAnimLayer"
             ]
             for icon_path in delete_icon_paths:
-                try:
-                    delete_icon = qtmax.LoadMaxMultiResIcon(icon_path)
-                    if delete_icon and not delete_icon.isNull():
-                        if len(delete_icon.availableSizes()) > 0:
-                            delete_layer_btn.setIcon(delete_icon)
-                            delete_layer_btn.setIconSize(QtCore.QSize(24, 24))
-                            delete_icon_loaded = True
-                            break
-                except:
-                    continue
+                delete_icon = _load_max_icon(icon_path)
+                if delete_icon:
+                    delete_layer_btn.setIcon(delete_icon)
+                    delete_layer_btn.setIconSize(QtCore.QSize(24, 24))
+                    delete_icon_loaded = True
+                    break
 
         if not delete_icon_loaded:
             delete_layer_btn.setText("-")
@@ -1247,186 +1592,268 @@ class EskiLayerManager(QtWidgets.QDockWidget):
         # Populate layers from 3ds Max
         self.populate_layers()
 
-    def populate_layers(self):
-        """Populate the layer list with layers from 3ds Max, including hierarchy"""
-        # Temporarily disconnect itemChanged signal to avoid triggering rename during population
-        try:
-            self.layer_tree.itemChanged.disconnect(self.on_layer_renamed)
-        except:
-            pass
+    def populate_layers(self, records=None):
+        """Populate the layer list with layers from 3ds Max, including hierarchy (records: a prefetched _fetch_layer_records result)"""
+        # Block tree signals during population so itemChanged doesn't trigger rename
+        # (QSignalBlocker restores the previous state on exit, even on early return/error)
+        with QtCore.QSignalBlocker(self.layer_tree):
+            try:
+                if rt is None:
+                    # Suspend repaints while the whole tree is rebuilt - one layout/paint at the end
+                    self.layer_tree.setUpdatesEnabled(False)
+                    self.layer_tree.clear()
 
-        # Save expanded state before clearing
-        expanded_layers = self._save_expanded_state()
+                    # Testing mode outside 3ds Max - add dummy data with hierarchy (single column)
+                    parent = QtWidgets.QTreeWidgetItem(self.layer_tree, ["[TEST MODE] Parent Layer"])
+                    parent.setData(0, QtCore.Qt.UserRole + 1, "👁")  # Visibility
 
-        self.layer_tree.clear()
+                    child1 = QtWidgets.QTreeWidgetItem(parent, ["[TEST MODE] Child 1"])
+                    child1.setData(0, QtCore.Qt.UserRole + 1, "👁")
 
-        if rt is None:
-            # Testing mode outside 3ds Max - add dummy data with hierarchy (single column)
-            parent = QtWidgets.QTreeWidgetItem(self.layer_tree, ["[TEST MODE] Parent Layer"])
-            parent.setData(0, QtCore.Qt.UserRole, "▼")  # Arrow
-            parent.setData(0, QtCore.Qt.UserRole + 1, "👁")  # Visibility
-            parent.setData(0, QtCore.Qt.UserRole + 2, "+")  # Add selection
-
-            child1 = QtWidgets.QTreeWidgetItem(parent, ["[TEST MODE] Child 1"])
-            child1.setData(0, QtCore.Qt.UserRole + 1, "👁")
-            child1.setData(0, QtCore.Qt.UserRole + 2, "+")
-
-            child2 = QtWidgets.QTreeWidgetItem(parent, ["[TEST MODE] Child 2"])
-            child2.setData(0, QtCore.Qt.UserRole + 1, "👁")
-            child2.setData(0, QtCore.Qt.UserRole + 2, "+")
-
-            root = QtWidgets.QTreeWidgetItem(self.layer_tree, ["[TEST MODE] Root Layer"])
-            root.setData(0, QtCore.Qt.UserRole + 1, "👁")
-            root.setData(0, QtCore.Qt.UserRole + 2, "+")
-
-            parent.setExpanded(True)  # Expand parent by default
-            # Reconnect signal
-            self.layer_tree.itemChanged.connect(self.on_layer_renamed)
-            return
+                    child2 = QtWidgets.QTreeWidgetItem(parent, ["[TEST MODE] Child 2"])
+                    child2.setData(0, QtCore.Qt.UserRole + 1, "👁")
 
-        try:
-            # Get the layer manager from 3ds Max
-            layer_manager = rt.layerManager
-            layer_count = layer_manager.count
+                    root = QtWidgets.QTreeWidgetItem(self.layer_tree, ["[TEST MODE] Root Layer"])
+                    root.setData(0, QtCore.Qt.UserRole + 1, "👁")
 
-            # Collect all layers first
-            all_layers = []
-            for i in range(layer_count):
-                layer = layer_manager.getLayer(i)
-                if layer:
-                    all_layers.append(layer)
+                    parent.setExpanded(True)  # Expand parent by default
+                    self.layer_tree.cache_sibling_flags()
+                    self._dirty = False
+                    return
 
-            # Separate into root layers and child layers
-            root_layers = []
-            for layer in all_layers:
                 try:
-                    parent = layer.getParent()
-                    # Check if parent is undefined/None (root layer)
-                    if parent is None or str(parent) == "undefined":
-                        root_layers.append(layer)
-                    else:
-                        pass  # Has parent, will be added as child later
-                except:
-                    # If getParent fails, assume it's a root layer
-                    root_layers.append(layer)
+                    # Probe visibility icons on first use only (skipped entirely in test mode)
+                    if not hasattr(self, 'use_native_icons'):
+                        self.load_visibility_icons()
 
-            # Sort root layers alphabetically
-            root_layers.sort(key=lambda x: str(x.name).lower())
+                    # Let the next layer event through to refresh_from_callback again
+                    rt.EskiLayerManagerPending = False
 
-            # Add root layers and their children recursively
-            for layer in root_layers:
-                self._add_layer_to_tree(layer, None)
+                    if records is None:
+                        records = self._fetch_layer_records()
+                    fingerprint = records
 
-            # Restore expanded state after populating
-            self._restore_expanded_state(expanded_layers)
+                    # Nothing changed in 3ds Max since the last build - keep the tree as is
+                    if fingerprint == self._layer_fingerprint:
+                        self._dirty = False
+                        return
 
-        except Exception as e:
-            print(f"[ERROR] populate_layers failed: {e}")
-            import traceback
-            traceback.print_exc()
-        finally:
-            # Reconnect signal
-            self.layer_tree.itemChanged.connect(self.on_layer_renamed)
-
-    def _add_layer_to_tree(self, layer, parent_item):
-        """Recursively add a layer and its children to the tree (single column with inline icons)"""
-        try:
-            layer_name = str(layer.name)
-            is_hidden = layer.ishidden
-            is_current = layer.current
+                    # Same layers and parents - only hidden/current flags changed, patch items in place
+                    old_records = self._layer_fingerprint
+                    if old_records is not None and len(old_records) == len(records) and all(
+                            old[:2] == new[:2] for old, new in zip(old_records, records)):
+                        self._update_layer_states(old_records, records)
+                        self._layer_fingerprint = fingerprint
+                        self._dirty = False
+                        return
 
-            # Check if this layer has children
-            try:
-                num_children = layer.getNumChildren()
-                has_children = num_children > 0
-                if has_children:
-                    pass  # Children will be added recursively
-            except:
-                has_children = False
+                    # Save expanded state before clearing
+                    expanded_layers = self._save_expanded_state()
+
+                    # A few layers created/deleted/reparented - move just those items
+                    if old_records is not None:
+                        self.layer_tree.setUpdatesEnabled(False)
+                        if self._apply_layer_changes(old_records, records):
+                            self._restore_expanded_state(expanded_layers)
+                            # Sibling flags changed around every inserted/removed item
+                            self.layer_tree.cache_sibling_flags()
+                            self._layer_fingerprint = fingerprint
+                            self._dirty = False
+                            return
 
-            # Create tree item - single column with just the layer name
-            if parent_item:
-                item = QtWidgets.QTreeWidgetItem(parent_item, [layer_name])
-            else:
-                item = QtWidgets.QTreeWidgetItem(self.layer_tree, [layer_name])
+                    # Suspend repaints while the whole tree is rebuilt - one layout/paint at the end
+                    self.layer_tree.setUpdatesEnabled(False)
+                    self.layer_tree.clear()
+
+                    # Pass 1: create every item unparented, indexed by layer name
+                    hidden_by_name = {record[0]: record[2] for record in records}
+                    items = {}
+                    children_by_parent = {}
+                    for record in records:
+                        layer_name, parent_name, is_hidden, _ = record
+                        items[layer_name] = self._create_layer_item(
+                            layer_name, is_hidden, hidden_by_name.get(parent_name, False))
+                        children_by_parent.setdefault(parent_name, []).append(layer_name)
+
+                    # Pass 2: attach each sibling group (sorted alphabetically) to its parent in one call
+                    # Don't expand by default - will be handled by _restore_expanded_state()
+                    for parent_name, child_names in children_by_parent.items():
+                        child_names.sort(key=str.lower)
+                        child_items = [items[name] for name in child_names]
+                        if parent_name in items:
+                            items[parent_name].addChildren(child_items)
+                        else:
+                            # Root layer ("" parent)
+                            self.layer_tree.addTopLevelItems(child_items)
+                    self._layer_items = items
+                    self._layer_rows = {record[0]: row for row, record in enumerate(records)}
 
-            # Store icon data in UserRole for delegate to paint
-            # UserRole: arrow (▼/▷)
-            # UserRole+1: visibility icon
-            # UserRole+2: add selection icon
+                    # Select the current/active layer (items must be in the tree first)
+                    for layer_name, _, _, is_current in records:
+                        if is_current:
+                            items[layer_name].setSelected(True)
 
-            # 1. Store arrow (only if has children)
-            if has_children:
-                arrow = "▼"  # Will be shown as expanded by default
-                item.setData(0, QtCore.Qt.UserRole, arrow)
+                    # Restore expanded state after populating
+                    self._restore_expanded_state(expanded_layers)
 
-            # 2. Store visibility icon
-            # Check if parent is hidden (child inherits parent's hidden state)
-            parent_hidden = False
-            if parent_item:
-                try:
-                    parent_layer = layer.getParent()
-                    # Check if parent exists (not rt.undefined)
-                    if parent_layer != rt.undefined and parent_layer is not None:
-                        parent_hidden = parent_layer.ishidden
-                except:
-                    pass
+                    # Cache sibling flags for branch line drawing
+                    self.layer_tree.cache_sibling_flags()
 
-            if self.use_native_icons:
-                # Choose icon based on visibility state
-                if parent_hidden and self.icon_hidden_light:
-                    # Parent is hidden - use light/disabled hidden icon
-                    icon = self.icon_hidden_light
-                elif is_hidden:
-                    # Layer is directly hidden
-                    icon = self.icon_hidden
-                else:
-                    # Layer is visible
-                    icon = self.icon_visible
-                item.setData(0, QtCore.Qt.UserRole + 1, icon)
-            else:
-                # Determine icon based on visibility state
-                if parent_hidden:
-                    icon_text = "🔒"  # Lock - hidden because parent is hidden
-                elif is_hidden:
-                    icon_text = "✖"  # Heavy X
-                else:
-                    icon_text = "👁"
-                item.setData(0, QtCore.Qt.UserRole + 1, icon_text)
+                    # Tree now matches 3ds Max
+                    self._layer_fingerprint = fingerprint
+                    self._dirty = False
 
-            # 3. Store add selection icon
-            if self.use_native_add_icon:
-                item.setData(0, QtCore.Qt.UserRole + 2, self.icon_add_selection)
-            else:
-                item.setData(0, QtCore.Qt.UserRole + 2, "+")
+                except Exception as e:
+                    print(f"[ERROR] populate_layers failed: {e}")
+                    if DEBUG:
+                        traceback.print_exc()
+            finally:
+                # No-op unless a rebuild path disabled updates
+                self.layer_tree.setUpdatesEnabled(True)
+
+    def _fetch_layer_records(self):
+        """Fetch every layer as (name, parent name, hidden, current) records in one MaxScript call"""
+        # Function defined on first use
+        if self._get_layer_records is None:
+            self._get_layer_records = rt.execute(_LAYER_RECORDS_FN)
+        names, parents, hidden, current, layers = self._get_layer_records()
+        self._layer_by_name = {str(name): layer for name, layer in zip(names, layers)}
+
+        # One record per layer - the tuple is also the populate_layers fingerprint
+        return tuple(
+            (str(name), str(parent), bool(is_hidden), bool(is_current))
+            for name, parent, is_hidden, is_current in zip(names, parents, hidden, current)
+        )
 
-            # Select the current/active layer
+    def _apply_layer_changes(self, old_records, records):
+        """Add, remove and move individual items for changed layers (False: rebuild the tree instead)"""
+        old_by_name = {record[0]: record for record in old_records}
+        new_by_name = {record[0]: record for record in records}
+        removed = [name for name in old_by_name if name not in new_by_name]
+        added = [record[0] for record in records if record[0] not in old_by_name]
+        moved = [record[0] for record in records
+                 if record[0] in old_by_name and old_by_name[record[0]][1] != record[1]]
+
+        # Large changes (e.g. a merged scene) are cheaper as one rebuild
+        if len(removed) + len(added) + len(moved) > max(16, len(records) // 4):
+            return False
+
+        items = self._layer_items
+        root = self.layer_tree.invisibleRootItem()
+
+        # Detach deleted and reparented items (a deleted parent's children are reparented too)
+        for name in removed + moved:
+            item = items.get(name)
+            if item is None or not isValid(item):
+                return False
+            (item.parent() or root).removeChild(item)
+        for name in removed:
+            del items[name]
+
+        # New layers start collapsed with their current icon
+        for name in added:
+            _, parent_name, is_hidden, _ = new_by_name[name]
+            parent_record = new_by_name.get(parent_name)
+            items[name] = self._create_layer_item(
+                name, is_hidden, parent_record is not None and parent_record[2])
+
+        # Insert at the alphabetical position under the new parent
+        for name in added + moved:
+            parent_name = new_by_name[name][1]
+            parent_item = items.get(parent_name) if parent_name else root
+            if parent_item is None:
+                return False
+            sibling_keys = [parent_item.child(i).text(0).lower() for i in range(parent_item.childCount())]
+            parent_item.insertChild(bisect.bisect_right(sibling_keys, name.lower()), items[name])
+
+        # Icons (own or parent's hidden flag changed) and current layer for surviving layers
+        # (removeChild drops the selection of a detached item and its subtree, so the current
+        # layer is reselected even when its flag is unchanged - a no-op if still selected)
+        for layer_name, parent_name, is_hidden, is_current in records:
+            old = old_by_name.get(layer_name)
             if is_current:
-                item.setSelected(True)
+                items[layer_name].setSelected(True)
+            if old is None:
+                continue
+            parent_record = new_by_name.get(parent_name)
+            old_parent_record = old_by_name.get(old[1])
+            parent_hidden = parent_record is not None and parent_record[2]
+            old_parent_hidden = old_parent_record is not None and old_parent_record[2]
+            if (is_hidden, parent_hidden) != (old[2], old_parent_hidden):
+                items[layer_name].setData(0, QtCore.Qt.UserRole + 1, self._visibility_icon(is_hidden, parent_hidden))
+            if old[3] and not is_current:
+                items[layer_name].setSelected(False)
+
+        self._layer_rows = {record[0]: row for row, record in enumerate(records)}
+        return True
+
+    def _update_layer_states(self, old_records, records):
+        """Patch visibility icons and selection of existing items (layer structure unchanged)"""
+        # Rows whose hidden/current flags changed (whole-record compare - names and parents match)
+        changed = [row for row, (old, new) in enumerate(zip(old_records, records)) if old != new]
+
+        # A layer's hidden flag also decides its direct children's icons
+        rows = set(changed)
+        for row in changed:
+            if old_records[row][2] != records[row][2]:
+                item = self._layer_items.get(records[row][0])
+                for i in range(item.childCount() if item is not None else 0):
+                    child_row = self._layer_rows.get(item.child(i).text(0))
+                    if child_row is not None:
+                        rows.add(child_row)
+
+        viewport = self.layer_tree.viewport()
+        for row in rows:
+            layer_name, parent_name, is_hidden, is_current = records[row]
+            item = self._layer_items.get(layer_name)
+            if item is None:
+                continue
+
+            # Icon depends on the layer's own and its parent's hidden flag
+            parent_row = self._layer_rows.get(parent_name)
+            parent_hidden = parent_row is not None and records[parent_row][2]
+            old_parent_hidden = parent_row is not None and old_records[parent_row][2]
+            if (is_hidden, parent_hidden) != (old_records[row][2], old_parent_hidden):
+                item.setData(0, QtCore.Qt.UserRole + 1, self._visibility_icon(is_hidden, parent_hidden))
+                # Repaint just this row
+                viewport.update(self.layer_tree.visualItemRect(item))
+
+            if is_current != old_records[row][3]:
+                item.setSelected(is_current)
+
+    def _visibility_icon(self, is_hidden, parent_hidden):
+        """Return the visibility icon (or fallback glyph) for a layer's hidden state"""
+        # (parent_hidden: child inherits parent's hidden state)
+        if self.use_native_icons:
+            # Choose icon based on visibility state
+            if parent_hidden and self.icon_hidden_light:
+                # Parent is hidden - use light/disabled hidden icon
+                return self.icon_hidden_light
+            elif is_hidden:
+                # Layer is directly hidden
+                return self.icon_hidden
+            else:
+                # Layer is visible
+                return self.icon_visible
 
-            # Recursively add children
-            if has_children:
-                # Don't expand by default - will be handled by _restore_expanded_state()
-                # (First time opening, all layers will be expanded by default)
+        # Determine icon based on visibility state
+        if parent_hidden:
+            return "🔒"  # Lock - hidden because parent is hidden
+        elif is_hidden:
+            return "✖"  # Heavy X
+        return "👁"
 
-                # Get all children and sort them alphabetically
-                children = []
-                for i in range(num_children):
-                    child = layer.getChild(i + 1)  # Note: getChild uses 1-based index
-                    if child:
-                        children.append(child)
+    def _create_layer_item(self, layer_name, is_hidden, parent_hidden):
+        """Create an unparented layer tree item (single column with inline icons)"""
+        item = QtWidgets.QTreeWidgetItem([layer_name])
 
-                # Sort children alphabetically
-                children.sort(key=lambda x: str(x.name).lower())
+        # Store icon data in UserRole for delegate to paint
+        # UserRole+1: visibility icon
+        # (Arrows are drawn by drawBranches and the add selection icon is a
+        # delegate default, so neither is stored per item)
+        item.setData(0, QtCore.Qt.UserRole + 1, self._visibility_icon(is_hidden, parent_hidden))
 
-                # Add each child recursively
-                for child in children:
-                    self._add_layer_to_tree(child, item)
-
-        except Exception as e:
-            print(f"[ERROR] _add_layer_to_tree failed for layer: {e}")
-            import traceback
-            traceback.print_exc()
+        return item
 
     def populate_objects(self, layer_name):
         """Populate the objects tree with objects from the specified layer (flat list)"""
@@ -1465,29 +1892,31 @@ class EskiLayerManager(QtWidgets.QDockWidget):
 
             self.progress_bar.setValue(50)
 
-            # Filter objects that belong to this layer
-            layer_objects = []
+            # Filter objects that belong to this layer (each name read from 3ds Max once)
+            object_names = []
             for node in all_nodes:
+                # Every scene node has a layer - no hasattr probe (an extra bridge call per node)
                 try:
-                    if hasattr(node, 'layer') and node.layer and str(node.layer.name) == layer_name:
-                        layer_objects.append(node)
-                except:
-                    pass
+                    node_layer = node.layer
+                    if node_layer and str(node_layer.name) == layer_name:
+                        object_names.append(str(node.name))
+                except Exception:
+                    pass  # Node deleted mid-iteration
 
             self.progress_bar.setValue(70)
 
-            # Sort objects by name
-            layer_objects.sort(key=lambda x: str(x.name).lower())
+            # Sort objects by name (plain strings - no bridge calls in the sort)
+            object_names.sort(key=str.lower)
 
-            # Add each object to the tree (flat list)
-            for obj in layer_objects:
-                try:
-                    obj_name = str(obj.name)
-                    item = QtWidgets.QTreeWidgetItem(self.objects_tree, [obj_name])
-                    # No icons for objects - just the name
+            # Create every item unparented (no icons for objects - just the name)
+            object_items = [QtWidgets.QTreeWidgetItem([obj_name]) for obj_name in object_names]
 
-                except Exception as e:
-                    print(f"[ERROR] Failed to add object to tree: {e}")
+            # Add them in one call with repaints suspended - one layout/paint at the end (flat list)
+            self.objects_tree.setUpdatesEnabled(False)
+            try:
+                self.objects_tree.addTopLevelItems(object_items)
+            finally:
+                self.objects_tree.setUpdatesEnabled(True)
 
             self.progress_bar.setValue(90)
 
@@ -1497,8 +1926,8 @@ class EskiLayerManager(QtWidgets.QDockWidget):
 
         except Exception as e:
             print(f"[ERROR] populate_objects failed: {e}")
-            import traceback
-            traceback.print_exc()
+            if DEBUG:
+                traceback.print_exc()
             # Reset progress on error
             self.progress_bar.setValue(0)
 
@@ -1518,43 +1947,18 @@ class EskiLayerManager(QtWidgets.QDockWidget):
             if current_layer:
                 current_layer_name = str(current_layer.name)
 
-                # Recursively find and select the matching item in the tree
-                def find_and_select(parent_item=None):
-                    if parent_item is None:
-                        # Check top-level items
-                        for i in range(self.layer_tree.topLevelItemCount()):
-                            item = self.layer_tree.topLevelItem(i)
-                            # Single column - text(0) is layer name
-                            if item.text(0) == current_layer_name:
-                                item.setSelected(True)
-                                return True
-                            # Check children recursively
-                            if find_and_select_children(item):
-                                return True
-                    return False
-
-                def find_and_select_children(parent_item):
-                    for i in range(parent_item.childCount()):
-                        child = parent_item.child(i)
-                        # Single column - text(0) is layer name
-                        if child.text(0) == current_layer_name:
-                            child.setSelected(True)
-                            return True
-                        # Check nested children
-                        if find_and_select_children(child):
-                            return True
-                    return False
-
-                found = find_and_select()
-                if found:
+                # Find and select the matching item in the tree (name index, iterator fallback)
+                item = self._find_tree_item_by_name(current_layer_name)
+                if item is not None:
+                    item.setSelected(True)
                     # Force viewport repaint to show highlight
                     self.layer_tree.viewport().update()
 
                 # Populate objects tree with current layer's objects
                 self.populate_objects(current_layer_name)
 
-        except Exception as e:
-            pass  # Debug print removed
+        except Exception:
+            pass
 
     def on_object_selection_changed(self):
         """Handle object selection change - select objects in 3ds Max scene"""
@@ -1583,8 +1987,8 @@ class EskiLayerManager(QtWidgets.QDockWidget):
 
         except Exception as e:
             print(f"[ERROR] on_object_selection_changed failed: {e}")
-            import traceback
-            traceback.print_exc()
+            if DEBUG:
+                traceback.print_exc()
 
     def on_layer_clicked(self, item, column):
         """Handle layer click - toggle visibility, add selection, or set active layer (single column)"""
@@ -1606,52 +2010,41 @@ class EskiLayerManager(QtWidgets.QDockWidget):
             index = self.layer_tree.indexFromItem(item)
             visual_rect = self.layer_tree.visualRect(index)
 
-            # Check if item has click regions (set by delegate during last paint)
-            if hasattr(item, 'click_regions') and hasattr(item, 'current_item_y'):
-                # Adjust click regions to current visual position (in case of scrolling)
-                # The stored regions use the Y from paint time, we need current Y
-                y_offset = visual_rect.y() - item.current_item_y
-
-                # Check which region was clicked
-                # (Skip arrow - Qt's built-in tree arrows handle expand/collapse)
-                if 'visibility' in item.click_regions:
-                    vis_rect = item.click_regions['visibility'].translated(0, y_offset)
-                    if vis_rect.contains(cursor_pos):
-                        # Check if Ctrl is pressed for isolate mode
-                        modifiers = QtWidgets.QApplication.keyboardModifiers()
-                        if modifiers & QtCore.Qt.ControlModifier:
-                            # Ctrl+Click on eye = Isolate layer (hide all others)
-                            self.isolate_layer(layer_name)
-                        else:
-                            # Normal click = Toggle visibility only
-                            self.toggle_layer_visibility(item, layer_name)
-                        return
+            # Hit-test the click regions at the current visual position (accounts for scrolling)
+            region = self.custom_delegate.hit_region(index, visual_rect, self.layer_tree, cursor_pos)
+
+            # Check which region was clicked
+            # (Skip arrow - Qt's built-in tree arrows handle expand/collapse)
+            if region == 'visibility':
+                # Check if Ctrl is pressed for isolate mode
+                modifiers = QtWidgets.QApplication.keyboardModifiers()
+                if modifiers & QtCore.Qt.ControlModifier:
+                    # Ctrl+Click on eye = Isolate layer (hide all others)
+                    self.isolate_layer(layer_name)
+                else:
+                    # Normal click = Toggle visibility only
+                    self.toggle_layer_visibility(item, layer_name)
+                return
 
-                if 'add_selection' in item.click_regions:
-                    add_rect = item.click_regions['add_selection'].translated(0, y_offset)
-                    if add_rect.contains(cursor_pos):
-                        # Add selected objects to this layer
-                        self.add_selection_to_layer(layer_name)
-                        return
+            if region == 'add_selection':
+                # Add selected objects to this layer
+                self.add_selection_to_layer(layer_name)
+                return
 
-                if 'name' in item.click_regions:
-                    name_rect = item.click_regions['name'].translated(0, y_offset)
-                    if name_rect.contains(cursor_pos):
-                        # Set as current layer (selection already handled by CustomTreeWidget)
-                        self.set_current_layer(layer_name)
-                        # Populate objects tree with objects from this layer
-                        self.populate_objects(layer_name)
-                        return
-            else:
-                pass  # No click_regions found
+            if region == 'name':
+                # Set as current layer (selection already handled by CustomTreeWidget)
+                self.set_current_layer(layer_name)
+                # Populate objects tree with objects from this layer
+                self.populate_objects(layer_name)
+                return
 
             # Fallback - if no regions matched, treat as name click
             self.set_current_layer(layer_name)
 
         except Exception as e:
-            import traceback
-            error_msg = f"Error handling layer click: {str(e)}\n{traceback.format_exc()}"
-            print(f"[ERROR] {error_msg}")
+            print(f"[ERROR] Error handling layer click: {e}")
+            if DEBUG:
+                traceback.print_exc()
 
     def toggle_layer_visibility(self, item, layer_name):
         """Toggle layer visibility (hide/unhide)"""
@@ -1723,9 +2116,6 @@ class EskiLayerManager(QtWidgets.QDockWidget):
 
                 self.progress_bar.setValue(70)
 
-                # Update our internal tracking BEFORE updating UI to prevent sync timer from reverting
-                self.last_visibility_states[layer_name] = new_hidden_state
-
                 # Update icon in UserRole+1 (native if available, Unicode fallback otherwise)
                 if self.use_native_icons:
                     item.setData(0, QtCore.Qt.UserRole + 1, self.icon_hidden if new_hidden_state else self.icon_visible)
@@ -1734,7 +2124,7 @@ class EskiLayerManager(QtWidgets.QDockWidget):
                     item.setData(0, QtCore.Qt.UserRole + 1, new_icon_text)
 
                 # Trigger repaint
-                self.layer_tree.update(self.layer_tree.indexFromItem(item))
+                self.layer_tree.viewport().update(self.layer_tree.visualItemRect(item))
 
                 # If this layer has children, update their icons too (they inherit hidden state)
                 self._update_child_layer_icons(item, new_hidden_state)
@@ -1752,73 +2142,60 @@ class EskiLayerManager(QtWidgets.QDockWidget):
                 QtCore.QTimer.singleShot(200, lambda: self.progress_bar.setValue(0))
 
         except Exception as e:
-            import traceback
-            error_msg = f"Error toggling layer visibility: {str(e)}\n{traceback.format_exc()}"
-            print(f"[ERROR] {error_msg}")
+            print(f"[ERROR] Error toggling layer visibility: {e}")
+            if DEBUG:
+                traceback.print_exc()
 
     def _update_child_layer_icons(self, parent_item, parent_is_hidden):
         """Recursively update icons for all child layers when parent visibility changes"""
         if not parent_item:
             return
 
-        # Iterate through all children
-        for i in range(parent_item.childCount()):
-            child_item = parent_item.child(i)
-            child_layer_name = child_item.text(0)
+        # Children's own hidden flags don't change with the parent's - read them from the
+        # last fetch (the sync poll corrects anything changed since), 3ds Max only if unknown
+        records = self._layer_fingerprint
 
-            try:
-                # Get the actual layer from 3ds Max
-                child_layer = self._find_layer_by_name(child_layer_name)
-                if not child_layer:
-                    continue
-
-                # Determine which icon to use
-                if parent_is_hidden:
-                    # Parent is hidden - use lock/disabled icon
-                    if self.use_native_icons and self.icon_hidden_light:
-                        child_item.setData(0, QtCore.Qt.UserRole + 1, self.icon_hidden_light)
-                    else:
-                        child_item.setData(0, QtCore.Qt.UserRole + 1, "🔒")
-                else:
-                    # Parent is visible - show child's own visibility state
-                    child_is_hidden = child_layer.ishidden
-                    if self.use_native_icons:
-                        icon = self.icon_hidden if child_is_hidden else self.icon_visible
-                        child_item.setData(0, QtCore.Qt.UserRole + 1, icon)
+        def update_recursive(tree_item):
+            for i in range(tree_item.childCount()):
+                child_item = tree_item.child(i)
+                child_layer_name = child_item.text(0)
+
+                try:
+                    row = self._layer_rows.get(child_layer_name)
+                    if records is not None and row is not None:
+                        child_is_hidden = records[row][2]
                     else:
-                        icon_text = "✖" if child_is_hidden else "👁"
-                        child_item.setData(0, QtCore.Qt.UserRole + 1, icon_text)
+                        child_layer = self._find_layer_by_name(child_layer_name)
+                        if not child_layer:
+                            continue
+                        child_is_hidden = child_layer.ishidden
 
-                # Trigger repaint
-                self.layer_tree.update(self.layer_tree.indexFromItem(child_item))
+                    # Lock/disabled icon while the parent is hidden, else the child's own state
+                    child_item.setData(0, QtCore.Qt.UserRole + 1,
+                                       self._visibility_icon(child_is_hidden, parent_is_hidden))
+
+                    # Recursively update grandchildren
+                    update_recursive(child_item)
+
+                except Exception as e:
+                    print(f"[ERROR] Failed to update child icon for '{child_layer_name}': {e}")
 
-                # Recursively update grandchildren
-                self._update_child_layer_icons(child_item, parent_is_hidden)
+        update_recursive(parent_item)
 
-            except Exception as e:
-                print(f"[ERROR] Failed to update child icon for '{child_layer_name}': {e}")
+        # One repaint for all changed rows
+        self.layer_tree.viewport().update()
 
     def _save_expanded_state(self):
         """Save the expanded/collapsed state of all layers before refresh"""
         expanded_layers = set()
 
-        def save_recursive(parent_item):
-            """Recursively save expanded state for all items"""
-            for i in range(parent_item.childCount()):
-                item = parent_item.child(i)
-                layer_name = item.text(0)
-                if item.isExpanded():
-                    expanded_layers.add(layer_name)
-                # Recursively check children
-                save_recursive(item)
-
-        # Save root items
-        for i in range(self.layer_tree.topLevelItemCount()):
-            item = self.layer_tree.topLevelItem(i)
-            layer_name = item.text(0)
+        # Flat pre-order walk on the C++ side (no Python recursion)
+        it = QtWidgets.QTreeWidgetItemIterator(self.layer_tree)
+        while it.value():
+            item = it.value()
             if item.isExpanded():
-                expanded_layers.add(layer_name)
-            save_recursive(item)
+                expanded_layers.add(item.text(0))
+            it += 1
 
         return expanded_layers
 
@@ -1831,90 +2208,65 @@ class EskiLayerManager(QtWidgets.QDockWidget):
             self.layer_tree.expandAll()
             return
 
-        def restore_recursive(parent_item):
-            """Recursively restore expanded state for all items"""
-            for i in range(parent_item.childCount()):
-                item = parent_item.child(i)
-                layer_name = item.text(0)
-                # Set expanded state based on saved state
-                if layer_name in expanded_layers:
-                    item.setExpanded(True)
-                else:
-                    item.setExpanded(False)
-                # Recursively restore children
-                restore_recursive(item)
-
-        # Restore root items
-        for i in range(self.layer_tree.topLevelItemCount()):
-            item = self.layer_tree.topLevelItem(i)
-            layer_name = item.text(0)
-            if layer_name in expanded_layers:
+        # Items are rebuilt collapsed - only expanded ones need a call (looked up by name)
+        for layer_name in expanded_layers:
+            item = self._layer_items.get(layer_name)
+            if item is not None:
                 item.setExpanded(True)
-            else:
-                item.setExpanded(False)
-            restore_recursive(item)
 
     def _find_layer_by_name(self, layer_name):
-        """Recursively search for a layer by name in the entire layer hierarchy"""
+        """Find a layer by name (name index from populate_layers, 3ds Max lookup as fallback)"""
         if rt is None:
             return None
 
-        layer_manager = rt.layerManager
-        layer_count = layer_manager.count
-
-        # Helper function to search recursively
-        def search_children(parent_layer):
+        layer = self._layer_by_name.get(layer_name)
+        if layer is not None:
             try:
-                num_children = parent_layer.getNumChildren()
-                for i in range(num_children):
-                    child = parent_layer.getChild(i + 1)  # 1-based index
-                    if child:
-                        if str(child.name) == layer_name:
-                            return child
-                        # Recursively search this child's children
-                        result = search_children(child)
-                        if result:
-                            return result
-            except:
+                # Cached layer may have been renamed or deleted since the last fetch
+                if str(layer.name) == layer_name:
+                    return layer
+            except Exception:
                 pass
-            return None
+            del self._layer_by_name[layer_name]
+
+        layer_manager = rt.layerManager
 
-        # First check root level layers
-        for i in range(layer_count):
+        # Direct lookup - one call, but 3ds Max matches names case-insensitively
+        layer = layer_manager.getLayerFromName(layer_name)
+        if layer is not None and layer != rt.undefined and str(layer.name) == layer_name:
+            return layer
+
+        # LayerManager indexes nested layers too - a flat scan covers the whole hierarchy
+        for i in range(layer_manager.count):
             layer = layer_manager.getLayer(i)
-            if layer:
-                if str(layer.name) == layer_name:
-                    return layer
-                # Search this layer's children
-                result = search_children(layer)
-                if result:
-                    return result
+            if layer and str(layer.name) == layer_name:
+                return layer
 
         return None
 
-    def _find_tree_item_by_name(self, layer_name):
-        """Recursively search for a tree item by layer name"""
-        def search_recursive(parent_item):
-            """Recursively search children"""
-            for i in range(parent_item.childCount()):
-                child = parent_item.child(i)
-                if child.text(0) == layer_name:  # Column 0 in single column layout
-                    return child
-                # Search this child's children
-                result = search_recursive(child)
-                if result:
-                    return result
+    def _cached_parent_name(self, layer_name):
+        """Parent layer name from the last fetch ("" for root, None if unknown or out of date)"""
+        # Hierarchy changes fire callbacks that set _dirty, so a clean fetch is still accurate
+        if self._dirty or self._layer_fingerprint is None:
+            return None
+        row = self._layer_rows.get(layer_name)
+        if row is None:
             return None
+        return self._layer_fingerprint[row][1]
 
-        # Search top-level items first
-        for i in range(self.layer_tree.topLevelItemCount()):
-            item = self.layer_tree.topLevelItem(i)
-            if item.text(0) == layer_name:
+    def _find_tree_item_by_name(self, layer_name):
+        """Find a tree item by layer name (name index from populate_layers, tree search as fallback)"""
+        item = self._layer_items.get(layer_name)
+        if item is not None and isValid(item) and item.text(0) == layer_name:
+            return item
+
+        # Flat pre-order walk on the C++ side (no Python recursion)
+        it = QtWidgets.QTreeWidgetItemIterator(self.layer_tree)
+        while it.value():
+            item = it.value()
+            if item.text(0) == layer_name:  # Column 0 in single column layout
                 return item
-            # Search children
-            result = search_recursive(item)
-            if result:
-                return result
+            it += 1
 
         return None
 
@@ -1939,8 +2291,9 @@ class EskiLayerManager(QtWidgets.QDockWidget):
                 # Show progress start
                 self.progress_bar.setValue(30)
 
-                # Escape layer name for MAXScript
-                escaped_name = layer_name.replace("\\", "\\\\").replace('"', '\\"')
+                # Whole selection assigned inside MaxScript (function defined on first use)
+                if self._add_selection_fn is None:
+                    self._add_selection_fn = rt.execute(_ADD_SELECTION_FN)
 
                 # Only use performance optimization for 10+ objects
                 if object_count >= 10:
@@ -1949,17 +2302,8 @@ class EskiLayerManager(QtWidgets.QDockWidget):
                         rt.disableSceneRedraw()
                         self.progress_bar.setValue(50)
 
-                        # Batch assign with undo support - use MAXScript with quiet mode
-                        rt.execute(f"""
-                        with undo "Add Selection to Layer" on
-                        (
-                            with quiet on
-                            (
-                                local targetLayer = layerManager.getLayerFromName "{escaped_name}"
-                                for obj in selection do targetLayer.addNode obj
-                            )
-                        )
-                        """)
+                        # Batch assign with undo support in quiet mode
+                        self._add_selection_fn(layer_name, True)
 
                         self.progress_bar.setValue(80)
 
@@ -1967,14 +2311,8 @@ class EskiLayerManager(QtWidgets.QDockWidget):
                         # Always re-enable scene redraw
                         rt.enableSceneRedraw()
                 else:
-                    # For small number of objects, wrap in undo context
-                    rt.execute(f"""
-                    with undo "Add Selection to Layer" on
-                    (
-                        local targetLayer = layerManager.getLayerFromName "{escaped_name}"
-                        for obj in selection do targetLayer.addNode obj
-                    )
-                    """)
+                    # For small number of objects, undo context only
+                    self._add_selection_fn(layer_name, False)
                     self.progress_bar.setValue(80)
 
                 # Complete refresh
@@ -1988,9 +2326,9 @@ class EskiLayerManager(QtWidgets.QDockWidget):
                 print(f"[ERROR] Layer '{layer_name}' not found")
 
         except Exception as e:
-            import traceback
-            error_msg = f"Error adding selection to layer: {str(e)}\n{traceback.format_exc()}"
-            print(f"[ERROR] {error_msg}")
+            print(f"[ERROR] Error adding selection to layer: {e}")
+            if DEBUG:
+                traceback.print_exc()
             # Make sure to re-enable scene redraw if we crashed mid-operation
             try:
                 rt.enableSceneRedraw()
@@ -2061,9 +2399,9 @@ class EskiLayerManager(QtWidgets.QDockWidget):
                 self.populate_objects(self.current_objects_layer)
 
         except Exception as e:
-            import traceback
-            error_msg = f"Error reassigning objects to layer: {str(e)}\n{traceback.format_exc()}"
-            print(f"[ERROR] {error_msg}")
+            print(f"[ERROR] Error reassigning objects to layer: {e}")
+            if DEBUG:
+                traceback.print_exc()
 
     def set_current_layer(self, layer_name):
         """Set the layer as current/active in 3ds Max"""
@@ -2077,12 +2415,11 @@ class EskiLayerManager(QtWidgets.QDockWidget):
             if layer:
                 # Set this layer as the current layer
                 layer.current = True
-                pass  # Debug print removed
 
         except Exception as e:
-            import traceback
-            error_msg = f"Error setting active layer: {str(e)}\n{traceback.format_exc()}"
-            print(f"[ERROR] {error_msg}")
+            print(f"[ERROR] Error setting active layer: {e}")
+            if DEBUG:
+                traceback.print_exc()
 
     def create_new_layer(self):
         """Create a new layer in 3ds Max"""
@@ -2123,9 +2460,8 @@ class EskiLayerManager(QtWidgets.QDockWidget):
                         # Store the original name before editing (required for on_layer_renamed to work)
                         self.editing_layer_name = new_layer_name
                         # Set the editable flag (required for editItem to work)
-                        self.layer_tree.blockSignals(True)
-                        item.setFlags(item.flags() | QtCore.Qt.ItemIsEditable)
-                        self.layer_tree.blockSignals(False)
+                        with QtCore.QSignalBlocker(self.layer_tree):
+                            item.setFlags(item.flags() | QtCore.Qt.ItemIsEditable)
                         # Enter edit mode (column 0 is the single column with all content)
                         self.layer_tree.editItem(item, 0)
 
@@ -2133,9 +2469,9 @@ class EskiLayerManager(QtWidgets.QDockWidget):
                 QtCore.QTimer.singleShot(100, start_rename)
 
         except Exception as e:
-            import traceback
-            error_msg = f"Error creating new layer: {str(e)}\n{traceback.format_exc()}"
-            print(f"[ERROR] {error_msg}")
+            print(f"[ERROR] Error creating new layer: {e}")
+            if DEBUG:
+                traceback.print_exc()
 
     def delete_selected_layer(self):
         """Delete the currently selected layer in the tree"""
@@ -2200,9 +2536,9 @@ class EskiLayerManager(QtWidgets.QDockWidget):
                 print(f"[ERROR] Layer '{layer_name}' not found")
 
         except Exception as e:
-            import traceback
-            error_msg = f"Error deleting layer: {str(e)}\n{traceback.format_exc()}"
-            print(f"[ERROR] {error_msg}")
+            print(f"[ERROR] Error deleting layer: {e}")
+            if DEBUG:
+                traceback.print_exc()
 
     def on_objects_toggle(self):
         """Handle Objects toggle button click - show/hide objects panel"""
@@ -2432,12 +2768,8 @@ class EskiLayerManager(QtWidgets.QDockWidget):
         is_expanded = item.isExpanded()
         item.setExpanded(not is_expanded)
 
-        # Update arrow icon in UserRole: ▼ when expanded, ▷ when collapsed
-        new_arrow = "▷" if is_expanded else "▼"
-        item.setData(0, QtCore.Qt.UserRole, new_arrow)
-
-        # Trigger repaint to show new arrow
-        self.layer_tree.update(self.layer_tree.indexFromItem(item))
+        # Trigger repaint to show new arrow (drawBranches reads the expanded state)
+        self.layer_tree.viewport().update(self.layer_tree.visualItemRect(item))
 
     def reparent_layer(self, layer_name, new_parent_name):
         """Reparent a layer in 3ds Max"""
@@ -2466,16 +2798,23 @@ class EskiLayerManager(QtWidgets.QDockWidget):
 
                 # Prevent circular reference (can't make layer child of its own descendant)
                 # Check if new_parent is a descendant of layer
-                temp = new_parent
-                while temp:
-                    parent = temp.getParent()
-                    if parent and str(parent) != "undefined":
-                        if str(parent.name) == layer_name:
+                ancestor = self._cached_parent_name(new_parent_name)
+                if ancestor is not None:
+                    # Walk the ancestor names from the last fetch - no getParent() calls
+                    seen = set()
+                    while ancestor and ancestor not in seen:
+                        if ancestor == layer_name:
                             print(f"[ERROR] Cannot make layer '{layer_name}' a child of its descendant '{new_parent_name}'")
                             return
-                        temp = parent
-                    else:
-                        break
+                        seen.add(ancestor)
+                        ancestor = self._cached_parent_name(ancestor) or ""
+                else:
+                    # Hierarchy changed since the last fetch - walk it inside 3ds Max in one call
+                    if self._is_descendant_fn is None:
+                        self._is_descendant_fn = rt.execute(_IS_DESCENDANT_FN)
+                    if self._is_descendant_fn(new_parent, layer_name):
+                        print(f"[ERROR] Cannot make layer '{layer_name}' a child of its descendant '{new_parent_name}'")
+                        return
 
             # Set the new parent with undo support using MAXScript
             escaped_layer_name = layer_name.replace("\\", "\\\\").replace('"', '\\"')
@@ -2505,9 +2844,9 @@ class EskiLayerManager(QtWidgets.QDockWidget):
             self.populate_layers()
 
         except Exception as e:
-            import traceback
-            error_msg = f"Error reparenting layer: {str(e)}\n{traceback.format_exc()}"
-            print(f"[ERROR] {error_msg}")
+            print(f"[ERROR] Error reparenting layer: {e}")
+            if DEBUG:
+                traceback.print_exc()
 
     def on_layer_double_clicked(self, item, column):
         """Handle layer double-click - start inline rename (single column layout)"""
@@ -2522,19 +2861,14 @@ class EskiLayerManager(QtWidgets.QDockWidget):
         visual_rect = self.layer_tree.visualRect(index)
 
         # Only rename if clicking in the name region, not on icons
-        if hasattr(item, 'click_regions') and hasattr(item, 'current_item_y'):
-            y_offset = visual_rect.y() - item.current_item_y
+        region = self.custom_delegate.hit_region(index, visual_rect, self.layer_tree, cursor_pos)
 
-            # Check if clicking on visibility or add selection icons - if so, don't rename
-            if 'visibility' in item.click_regions:
-                vis_rect = item.click_regions['visibility'].translated(0, y_offset)
-                if vis_rect.contains(cursor_pos):
-                    return  # Don't rename when clicking eye icon
+        # Check if clicking on visibility or add selection icons - if so, don't rename
+        if region == 'visibility':
+            return  # Don't rename when clicking eye icon
 
-            if 'add_selection' in item.click_regions:
-                add_rect = item.click_regions['add_selection'].translated(0, y_offset)
-                if add_rect.contains(cursor_pos):
-                    return  # Don't rename when clicking + icon
+        if region == 'add_selection':
+            return  # Don't rename when clicking + icon
 
         # Don't process test mode items
         layer_name = item.text(0)
@@ -2545,9 +2879,9 @@ class EskiLayerManager(QtWidgets.QDockWidget):
         self.editing_layer_name = layer_name
 
         # Block signals while making item editable to avoid premature itemChanged trigger
-        self.layer_tree.blockSignals(True)
-        item.setFlags(item.flags() | QtCore.Qt.ItemIsEditable)
-        self.layer_tree.blockSignals(False)
+        # (QSignalBlocker restores the previous state on exit, even on error)
+        with QtCore.QSignalBlocker(self.layer_tree):
+            item.setFlags(item.flags() | QtCore.Qt.ItemIsEditable)
 
         # Now start editing (column 0 = single column with name)
         self.layer_tree.editItem(item, 0)
@@ -2664,21 +2998,21 @@ class EskiLayerManager(QtWidgets.QDockWidget):
         if rt is None or self.editing_layer_name is None:
             return
 
+        # The item text was edited in place - the next populate must rebuild even if the rename fails
+        self._layer_fingerprint = None
+        self._layer_by_name.pop(self.editing_layer_name, None)
+
         try:
             # Get the new name from the item (column 0)
             new_name = item.text(0)
             old_name = self.editing_layer_name
 
-            pass  # Debug print removed
-
             # Don't process test mode items
             if old_name.startswith("[TEST MODE]"):
-                pass  # Debug print removed
                 return
 
             # Only process if name actually changed
             if new_name != old_name and new_name:
-                pass  # Debug print removed
                 # Escape names for MAXScript
                 escaped_old_name = old_name.replace("\\", "\\\\").replace('"', '\\"')
                 escaped_new_name = new_name.replace("\\", "\\\\").replace('"', '\\"')
@@ -2695,8 +3029,6 @@ class EskiLayerManager(QtWidgets.QDockWidget):
 
                 # Refresh the layer list to re-sort alphabetically
                 self.populate_layers()
-            else:
-                pass  # Debug print removed
 
             # Reset editing flag
             self.editing_layer_name = None
@@ -2705,17 +3037,36 @@ class EskiLayerManager(QtWidgets.QDockWidget):
             item.setFlags(item.flags() & ~QtCore.Qt.ItemIsEditable)
 
         except Exception as e:
-            import traceback
-            error_msg = f"Error renaming layer: {str(e)}\n{traceback.format_exc()}"
-            print(f"[ERROR] {error_msg}")
+            print(f"[ERROR] Error renaming layer: {e}")
+            if DEBUG:
+                traceback.print_exc()
             # Reset editing flag
             self.editing_layer_name = None
 
     def showEvent(self, event):
-        """Handle show event - refresh layers when window is shown"""
+        """Handle show event - refresh layers when window is shown (only if stale)"""
         super(EskiLayerManager, self).showEvent(event)
-        # Refresh layers when window is shown
-        self.populate_layers()
+        # Reopened after close - re-register what closeEvent tore down
+        if self._closed:
+            self._closed = False
+            # Start over like a new window would (a deleted-on-close window used to be recreated)
+            self._reset_view_state()
+            self._select_active_timer.start()
+            self.setup_callbacks()
+            self._idle_sync_ticks = 0
+            self.sync_timer.start(SYNC_INTERVAL)
+            self.tip_timer.start(12000)
+        # Dock/undock/restack fires showEvent too - skip rebuild if callbacks kept us in sync
+        if self._dirty:
+            self.populate_layers()
+
+    def _reset_view_state(self):
+        """Forget per-window state tied to what was last shown (isolation, listed objects, current layer)"""
+        self.editing_layer_name = None
+        self.last_current_layer = None
+        self.current_objects_layer = None
+        self.isolation_state = None
+        self.isolated_layer = None
 
     def eventFilter(self, obj, event):
         """Filter events to pass through keyboard shortcuts to 3ds Max"""
@@ -2762,9 +3113,25 @@ class EskiLayerManager(QtWidgets.QDockWidget):
         """Setup timer to poll for current layer changes (syncs with native layer manager)"""
         self.sync_timer = QtCore.QTimer(self)
         self.sync_timer.timeout.connect(self.check_current_layer_sync)
-        # Check every 500ms for current layer changes
-        self.sync_timer.start(500)
-        pass  # Debug print removed
+        # Check every 500ms for current layer changes (slows down while nothing changes)
+        self._idle_sync_ticks = 0
+        self.sync_timer.start(SYNC_INTERVAL)
+
+    def _set_sync_active(self, changed):
+        """Poll at SYNC_INTERVAL after a change, back off to SYNC_IDLE_INTERVAL when idle"""
+        if changed:
+            self._idle_sync_ticks = 0
+            if self.sync_timer.interval() != SYNC_INTERVAL:
+                self.sync_timer.setInterval(SYNC_INTERVAL)
+        else:
+            self._idle_sync_ticks += 1
+            if self._idle_sync_ticks == SYNC_IDLE_TICKS:
+                self.sync_timer.setInterval(SYNC_IDLE_INTERVAL)
+
+    def _request_refresh(self):
+        """Queue one populate_layers once callbacks go quiet for 50ms - repeated requests are merged"""
+        # start() on an active single-shot timer restarts it (trailing-edge debounce)
+        self._refresh_timer.start()
 
     def start_tip_rotation(self):
         """Start the tip rotation timer and show first tip"""
@@ -2844,114 +3211,36 @@ class EskiLayerManager(QtWidgets.QDockWidget):
         # Show the dialog (non-modal so user can still interact with main window)
         dialog.show()
 
-    def _update_layer_icon_recursive(self, parent_item, layer_name, is_hidden):
-        """Recursively search tree and update icon for matching layer"""
-        for i in range(parent_item.childCount()):
-            item = parent_item.child(i)
-            if item.text(0) == layer_name:  # Single column - layer name in column 0
-                # Check if this layer's parent is hidden
-                parent_is_hidden = False
-                parent_tree_item = item.parent()
-
-                # If this item has a parent in the tree (not root), check if parent layer is hidden
-                if parent_tree_item and parent_tree_item != self.layer_tree.invisibleRootItem():
-                    try:
-                        # Get the layer from 3ds Max
-                        layer = self._find_layer_by_name(layer_name)
-                        if layer:
-                            parent_layer = layer.getParent()
-                            if parent_layer != rt.undefined and parent_layer is not None:
-                                parent_is_hidden = parent_layer.ishidden
-                    except:
-                        pass
-
-                # Update icon based on parent state
-                if parent_is_hidden:
-                    # Parent is hidden - use lock/disabled icon
-                    if self.use_native_icons and self.icon_hidden_light:
-                        item.setData(0, QtCore.Qt.UserRole + 1, self.icon_hidden_light)
-                    else:
-                        item.setData(0, QtCore.Qt.UserRole + 1, "🔒")
-                else:
-                    # Parent is visible - use normal icon based on layer's own state
-                    if self.use_native_icons:
-                        item.setData(0, QtCore.Qt.UserRole + 1, self.icon_hidden if is_hidden else self.icon_visible)
-                    else:
-                        new_icon_text = "✖" if is_hidden else "👁"
-                        item.setData(0, QtCore.Qt.UserRole + 1, new_icon_text)
-
-                # Trigger repaint
-                self.layer_tree.update(self.layer_tree.indexFromItem(item))
-                return True
-            # Recursively check children
-            if self._update_layer_icon_recursive(item, layer_name, is_hidden):
-                return True
-        return False
-
     def check_current_layer_sync(self):
         """Check if the current layer or visibility states changed in Max and update UI"""
-        if rt is None:
+        # Nothing to show while hidden (e.g. tabbed behind another panel) - the next tick after a show catches up
+        if rt is None or not self.isVisible():
             return
 
-        try:
-            # Get current layer from Max
-            layer_manager = rt.layerManager
-            current_layer = layer_manager.current
-            layer_count = layer_manager.count
-
-            # Check if layer count changed (layer added/deleted via undo/redo)
-            if not hasattr(self, 'last_layer_count'):
-                self.last_layer_count = layer_count
-
-            if layer_count != self.last_layer_count:
-                self.last_layer_count = layer_count
-                # Full refresh on layer count change
-                self.populate_layers()
-                return
-
-            # Build current layer names list to detect renames
-            current_layer_names = set()
-            for i in range(layer_count):
-                layer = layer_manager.getLayer(i)
-                if layer:
-                    current_layer_names.add(str(layer.name))
+        # 3ds Max in the background - the user isn't changing anything, catch up once it's active again
+        if QtWidgets.QApplication.applicationState() != QtCore.Qt.ApplicationActive:
+            return
 
-            # Check if layer names changed (rename via undo/redo)
-            if not hasattr(self, 'last_layer_names'):
-                self.last_layer_names = current_layer_names
+        try:
+            # All layers (names, parents, hidden and current flags) in one MaxScript call
+            records = self._fetch_layer_records()
 
-            if current_layer_names != self.last_layer_names:
-                self.last_layer_names = current_layer_names
-                # Full refresh on name changes
-                self.populate_layers()
-                return
+            # Layers changed outside this panel (undo/redo, Max's own layer explorer) - hidden/current
+            # changes are patched in place, added/deleted/renamed/reparented layers rebuild the tree
+            changed = records != self._layer_fingerprint
+            if changed:
+                self.populate_layers(records)
 
             # Check if current layer changed
-            if current_layer:
-                current_layer_name = str(current_layer.name)
-
-                if current_layer_name != self.last_current_layer:
-                    pass  # Debug print removed
-                    self.last_current_layer = current_layer_name
-                    # Update selection in tree
-                    self.select_active_layer()
-
-            # Check visibility states for all layers
-            visibility_changed = False
-
-            for i in range(layer_count):
-                layer = layer_manager.getLayer(i)
-                if layer:
-                    layer_name = str(layer.name)
-                    is_hidden = layer.ishidden
-
-                    # Check if visibility changed for this layer
-                    if layer_name not in self.last_visibility_states or self.last_visibility_states[layer_name] != is_hidden:
-                        self.last_visibility_states[layer_name] = is_hidden
-                        visibility_changed = True
+            current_layer_name = next((record[0] for record in records if record[3]), None)
+            if current_layer_name is not None and current_layer_name != self.last_current_layer:
+                changed = True
+                self.last_current_layer = current_layer_name
+                # Update selection in tree
+                self.select_active_layer()
 
-                        # Update the icon in the tree (single column layout - column 0)
-                        self._update_layer_icon_recursive(self.layer_tree.invisibleRootItem(), layer_name, is_hidden)
+            # Back to the fast interval while things change, slow down once idle
+            self._set_sync_active(changed)
 
             # Check which layers contain selected objects
             self.update_selection_indicators()
@@ -2966,22 +3255,11 @@ class EskiLayerManager(QtWidgets.QDockWidget):
             return
 
         try:
-            # Get currently selected objects
-            selection = rt.selection
-
-            # Build set of layer names that contain selected objects
-            new_layers_with_selection = set()
-
-            # For each selected object, find which layer it belongs to
-            for obj in selection:
-                try:
-                    # Direct approach: get the layer property from the object
-                    obj_layer = obj.layer
-                    if obj_layer:
-                        layer_name = str(obj_layer.name)
-                        new_layers_with_selection.add(layer_name)
-                except:
-                    pass  # Silently skip objects without layers
+            # Build set of layer names that contain selected objects (one MaxScript call,
+            # function defined on first use)
+            if self._get_selection_layers is None:
+                self._get_selection_layers = rt.execute(_SELECTION_LAYERS_FN)
+            new_layers_with_selection = {str(name) for name in self._get_selection_layers()}
 
             # Only update if the set changed
             if new_layers_with_selection != self.layers_with_selection:
@@ -2994,63 +3272,24 @@ class EskiLayerManager(QtWidgets.QDockWidget):
 
     def setup_callbacks(self):
         """Setup 3ds Max callbacks for automatic layer refresh"""
+        global _callback_fns_defined
+
         if rt is None:
             return
 
         try:
-            # Create callback functions
-            callback_code = """
-global EskiLayerManagerCallback
-fn EskiLayerManagerCallback = (
-    python.Execute "import eski_layer_manager; eski_layer_manager.refresh_from_callback()"
-)
-
-global EskiLayerManagerCurrentCallback
-fn EskiLayerManagerCurrentCallback = (
-    python.Execute "import eski_layer_manager; eski_layer_manager.sync_current_layer()"
-)
-
-global EskiLayerManagerSceneCallback
-fn EskiLayerManagerSceneCallback = (
-    python.Execute "import eski_layer_manager; eski_layer_manager.refresh_on_scene_change()"
-)
-
-global EskiLayerManagerSelectionCallback
-fn EskiLayerManagerSelectionCallback = (
-    python.Execute "import eski_layer_manager; eski_layer_manager.update_selection_from_callback()"
-)
-"""
-            rt.execute(callback_code)
-
-            # Register callbacks for layer-related events (use regular refresh)
-            rt.callbacks.addScript(rt.Name("layerCreated"), "EskiLayerManagerCallback()")
-            rt.callbacks.addScript(rt.Name("layerDeleted"), "EskiLayerManagerCallback()")
-            rt.callbacks.addScript(rt.Name("nodeLayerChanged"), "EskiLayerManagerCallback()")
-            rt.callbacks.addScript(rt.Name("layerParentChanged"), "EskiLayerManagerCallback()")
-
-            # Register callback for current layer changes (just update selection, no full refresh)
-            # Try both possible callback names for layer current change
-            try:
-                rt.callbacks.addScript(rt.Name("layerCurrent"), "EskiLayerManagerCurrentCallback()")
-                pass  # Debug print removed
-            except:
-                pass  # Debug print removed
-                # Some Max versions might use different callback names
-                # We'll rely on the refresh from clicking in our UI instead
-
-
-            # Register callbacks for scene events (use scene refresh - reopen window)
-            rt.callbacks.addScript(rt.Name("filePostOpen"), "EskiLayerManagerSceneCallback()")
-            rt.callbacks.addScript(rt.Name("systemPostReset"), "EskiLayerManagerSceneCallback()")
-            rt.callbacks.addScript(rt.Name("systemPostNew"), "EskiLayerManagerSceneCallback()")
-            # Note: postMerge callback not supported in 3ds Max 2026
-
-            # Register callback for selection changes (update green dot indicators)
-            rt.callbacks.addScript(rt.Name("selectionSetChanged"), "python.execute('import eski_layer_manager; eski_layer_manager.update_selection_from_callback()')", id=rt.Name("EskiLayerManagerSelectionCallback"))
-
-            pass  # Debug print removed
+            # Callback functions are defined once per session - a reopen only re-registers events
+            if _callback_fns_defined:
+                rt.execute(_CALLBACK_REGISTRATIONS)
+            else:
+                # Define callback functions and register all events in one MAXScript call
+                rt.execute(_CALLBACK_FNS + _CALLBACK_REGISTRATIONS)
+                _callback_fns_defined = True
         except Exception as e:
-            pass  # Debug print removed
+            # Without callbacks the panel only follows 3ds Max through the sync poll
+            print(f"[ERROR] setup_callbacks failed: {e}")
+            if DEBUG:
+                traceback.print_exc()
 
     def remove_callbacks(self):
         """Remove 3ds Max callbacks"""
@@ -3058,19 +3297,15 @@ fn EskiLayerManagerSelectionCallback = (
             return
 
         try:
-            # Remove all instances of our callback
-            rt.callbacks.removeScripts(rt.Name("layerCreated"), id=rt.Name("EskiLayerManagerCallback"))
-            rt.callbacks.removeScripts(rt.Name("layerDeleted"), id=rt.Name("EskiLayerManagerCallback"))
-            rt.callbacks.removeScripts(rt.Name("nodeLayerChanged"), id=rt.Name("EskiLayerManagerCallback"))
-            rt.callbacks.removeScripts(rt.Name("layerCurrent"), id=rt.Name("EskiLayerManagerCurrentCallback"))
-            rt.callbacks.removeScripts(rt.Name("selectionSetChanged"), id=rt.Name("EskiLayerManagerSelectionCallback"))
-            rt.callbacks.removeScripts(rt.Name("filePostOpen"), id=rt.Name("EskiLayerManagerCallback"))
-            rt.callbacks.removeScripts(rt.Name("systemPostReset"), id=rt.Name("EskiLayerManagerCallback"))
-            rt.callbacks.removeScripts(rt.Name("systemPostNew"), id=rt.Name("EskiLayerManagerCallback"))
-            # Note: postMerge callback not supported in 3ds Max 2026
-            pass  # Debug print removed
-        except Exception as e:
-            pass  # Debug print removed
+            # Remove all instances of our callbacks (every event registered under each id)
+            rt.execute("""
+callbacks.removeScripts id:#EskiLayerManagerCallback
+callbacks.removeScripts id:#EskiLayerManagerCurrentCallback
+callbacks.removeScripts id:#EskiLayerManagerSceneCallback
+callbacks.removeScripts id:#EskiLayerManagerSelectionCallback
+""")
+        except Exception:
+            pass
 
     def get_dock_widgets_in_area(self, dock_area):
         """
@@ -3174,22 +3409,26 @@ fn EskiLayerManagerSelectionCallback = (
             # Format: floating;dock_area;x;y;width;height;relative_above;relative_below
             position_data = f"{is_floating};{dock_area};{pos.x()};{pos.y()};{size.width()};{size.height()};{relative_above};{relative_below}"
 
-            # Save to current .max file using fileProperties
-            # First, try to delete existing properties if they exist
-            try:
-                existing = rt.fileProperties.findProperty(rt.Name("custom"), "EskiLayerManagerPosition")
-                if existing:
-                    rt.fileProperties.deleteProperty(existing)
-            except:
-                pass  # Property doesn't exist yet
+            # Already stored in this scene - skip rewriting the file properties
+            scene_path = self._scene_path()
+            if scene_path and _position_cache.get(scene_path) == position_data:
+                return
 
-            # Add new property - addProperty signature: (#custom, name, value)
-            rt.fileProperties.addProperty(rt.Name("custom"), "EskiLayerManagerPosition", position_data)
+            # Save to current .max file using fileProperties
+            # addProperty signature: (#custom, name, value) - replaces the value if the property
+            # already exists, so no findProperty/deleteProperty round trips are needed first
+            rt.fileProperties.addProperty(_CUSTOM_PROPS, "EskiLayerManagerPosition", position_data)
+            if scene_path:
+                _position_cache[scene_path] = position_data
 
         except Exception as e:
             print(f"[ERROR] save_position failed: {e}")
-            import traceback
-            traceback.print_exc()
+            if DEBUG:
+                traceback.print_exc()
+
+    def _scene_path(self):
+        """Full path of the current .max file ("" for an unsaved scene)"""
+        return str(rt.maxFilePath) + str(rt.maxFileName)
 
     def get_saved_position(self):
         """
@@ -3201,74 +3440,37 @@ fn EskiLayerManagerSelectionCallback = (
             return None
 
         try:
-            # Load from current .max file using fileProperties
-            # findProperty returns the index (1-based), not the property object
-            prop_index = rt.fileProperties.findProperty(rt.Name("custom"), "EskiLayerManagerPosition")
-
-            # If findProperty returns 0, property doesn't exist
-            if not prop_index or prop_index == 0:
-                return None
-
-            # Get the actual property value using the index
-            position_data = str(rt.fileProperties.getPropertyValue(rt.Name("custom"), prop_index))
+            # Reuse the string read or written earlier for this scene (saved scenes only)
+            scene_path = self._scene_path()
+            position_data = _position_cache.get(scene_path) if scene_path else None
+            if position_data is None:
+                # Load from current .max file using fileProperties
+                # findProperty returns the index (1-based), not the property object
+                prop_index = rt.fileProperties.findProperty(_CUSTOM_PROPS, "EskiLayerManagerPosition")
+
+                # If findProperty returns 0, property doesn't exist
+                if not prop_index or prop_index == 0:
+                    return None
+
+                # Get the actual property value using the index
+                position_data = str(rt.fileProperties.getPropertyValue(_CUSTOM_PROPS, prop_index))
+                if scene_path:
+                    _position_cache[scene_path] = position_data
 
             if not position_data or position_data == "":
                 return None
 
-            # Parse position data
-            parts = position_data.split(";")
-
-            # Support multiple formats for backwards compatibility
-            if len(parts) == 8:
-                # New format: floating;dock_area;x;y;width;height;relative_above;relative_below
-                result = {
-                    'floating': parts[0] == "True",
-                    'dock_area': parts[1],
-                    'x': int(parts[2]),
-                    'y': int(parts[3]),
-                    'width': int(parts[4]),
-                    'height': int(parts[5]),
-                    'relative_above': parts[6] if parts[6] != "none" else None,
-                    'relative_below': parts[7] if parts[7] != "none" else None
-                }
-                return result
-            elif len(parts) == 6:
-                # Old format: floating;dock_area;x;y;width;height
-                result = {
-                    'floating': parts[0] == "True",
-                    'dock_area': parts[1],
-                    'x': int(parts[2]),
-                    'y': int(parts[3]),
-                    'width': int(parts[4]),
-                    'height': int(parts[5]),
-                    'relative_above': None,
-                    'relative_below': None
-                }
-                return result
-            elif len(parts) == 5:
-                # Very old format: floating;x;y;width;height (no dock_area)
-                result = {
-                    'floating': parts[0] == "True",
-                    'dock_area': "none",
-                    'x': int(parts[1]),
-                    'y': int(parts[2]),
-                    'width': int(parts[3]),
-                    'height': int(parts[4]),
-                    'relative_above': None,
-                    'relative_below': None
-                }
-                return result
-            else:
-                return None
+            # Parsed once per distinct string - reopening the panel reuses the dict
+            return _parse_position_data(position_data)
 
         except Exception as e:
             print(f"[ERROR] get_saved_position failed: {e}")
-            import traceback
-            traceback.print_exc()
+            if DEBUG:
+                traceback.print_exc()
             return None
 
     def closeEvent(self, event):
-        """Handle close event"""
+        """Handle close event - hide instead of deleting so reopening is instant"""
 
         # Stop sync timer
         if hasattr(self, 'sync_timer'):
@@ -3278,17 +3480,61 @@ fn EskiLayerManagerSelectionCallback = (
         if hasattr(self, 'tip_timer'):
             self.tip_timer.stop()
 
+        # Drop a queued refresh - showEvent rebuilds if the scene changed while hidden
+        self._refresh_timer.stop()
+        self._select_active_timer.stop()
+
         # Save position before closing
         self.save_position()
 
         # Remove callbacks
         self.remove_callbacks()
 
-        # Clear the global instance reference
-        global _layer_manager_instance
-        _layer_manager_instance[0] = None
+        # Scene may change while hidden - rebuild on the next show
+        self._dirty = True
+        self._closed = True
+
+        # Keep the instance (and the global reference) alive, just hide it
+        event.ignore()
+        self.hide()
+
+
+def _on_instance_destroyed(instance):
+    """
+    Called when Qt destroys the layer manager's C++ object
+    Nulls the singleton reference (QPointer-style) so liveness is a plain None check
+    """
+    global _layer_manager_instance
+
+    # A replacement instance may already exist (e.g. 3ds Max tearing down its children late)
+    if _layer_manager_instance is instance:
+        _layer_manager_instance = None
 
-        super().closeEvent(event)
+
+def _on_about_to_quit():
+    """Drop the current singleton reference before Qt tears everything down on exit"""
+    instance = _layer_manager_instance
+    if instance is not None:
+        _on_instance_destroyed(instance)
+
+
+def _discard_instance(instance):
+    """
+    Retire an instance whose class predates a module reload (the installer reloads on upgrade)
+    The reused hidden instance would otherwise keep running the old code for the whole session
+    """
+    global _layer_manager_instance
+
+    if _layer_manager_instance is instance:
+        _layer_manager_instance = None
+    # Anything but a live widget (e.g. state left by an older version) is just dropped
+    if not isinstance(instance, QtWidgets.QWidget) or not isValid(instance):
+        return
+
+    # closeEvent saves the position, removes callbacks and stops timers
+    if instance.isVisible():
+        instance.close()
+    instance.deleteLater()
 
 
 def refresh_from_callback():
@@ -3298,15 +3544,13 @@ def refresh_from_callback():
     """
     global _layer_manager_instance
 
-    if _layer_manager_instance[0] is not None:
-        try:
-            # Check if widget is still valid
-            _layer_manager_instance[0].isVisible()
-            # Refresh the layers
-            _layer_manager_instance[0].populate_layers()
-        except (RuntimeError, AttributeError):
-            # Widget was deleted
-            _layer_manager_instance[0] = None
+    instance = _layer_manager_instance
+    if instance is not None:
+        # Mark stale, then queue a refresh (a burst of callbacks rebuilds once)
+        instance._dirty = True
+        # Hidden (e.g. tabbed behind another panel) - showEvent rebuilds once when shown
+        if instance.isVisible():
+            instance._request_refresh()
 
 
 def sync_current_layer():
@@ -3316,15 +3560,11 @@ def sync_current_layer():
     """
     global _layer_manager_instance
 
-    if _layer_manager_instance[0] is not None:
-        try:
-            # Check if widget is still valid
-            _layer_manager_instance[0].isVisible()
-            # Update selection to match current layer
-            _layer_manager_instance[0].select_active_layer()
-        except (RuntimeError, AttributeError):
-            # Widget was deleted
-            _layer_manager_instance[0] = None
+    instance = _layer_manager_instance
+    if instance is not None and instance.isVisible():
+        # Queue the selection update (a burst of current-layer changes selects once)
+        # (while hidden, the sync poll picks up the current layer after the next show)
+        instance._select_active_timer.start()
 
 
 def update_selection_from_callback():
@@ -3334,35 +3574,33 @@ def update_selection_from_callback():
     """
     global _layer_manager_instance
 
-    if _layer_manager_instance[0] is not None:
-        try:
-            # Check if widget is still valid
-            _layer_manager_instance[0].isVisible()
-            # Update selection indicators (green dots)
-            _layer_manager_instance[0].update_selection_indicators()
-        except (RuntimeError, AttributeError):
-            # Widget was deleted
-            _layer_manager_instance[0] = None
+    instance = _layer_manager_instance
+    if instance is not None and instance.isVisible():
+        # Update selection indicators (green dots - refreshed by the sync poll after a show)
+        instance.update_selection_indicators()
 
 
 def refresh_on_scene_change():
     """
     Called by scene change callbacks (file open, reset, new, merge)
-    Closes current instance and opens a fresh one
+    Rebuilds the open instance's trees in place (callbacks and timers stay registered)
     """
     global _layer_manager_instance
 
-    if _layer_manager_instance[0] is not None:
-        try:
-            # Check if widget is still valid and visible
-            if _layer_manager_instance[0].isVisible():
-                # Close the current instance
-                _layer_manager_instance[0].close()
-                # Open a new instance
-                show_layer_manager()
-        except (RuntimeError, AttributeError):
-            # Widget was deleted
-            _layer_manager_instance[0] = None
+    # Scene on disk may differ from what this session cached for the same path
+    _position_cache.clear()
+
+    instance = _layer_manager_instance
+    if instance is not None:
+        # Different scene - rebuild from scratch rather than diffing against the old layers,
+        # and drop isolation/listed-objects state that refers to the previous scene's layers
+        instance._dirty = True
+        instance._layer_fingerprint = None
+        instance._reset_view_state()
+        if instance.isVisible():
+            instance._refresh_timer.stop()
+            instance.populate_layers()
+            instance.select_active_layer()
 
 
 def get_instance_status():
@@ -3375,34 +3613,55 @@ def get_instance_status():
     """
     global _layer_manager_instance
 
-    if '_layer_manager_instance' not in globals():
-        return {
-            'exists': False,
-            'reason': 'Global variable not initialized'
-        }
-
-    if _layer_manager_instance[0] is None:
+    instance = _layer_manager_instance
+    if instance is None:
         return {
             'exists': False,
             'reason': 'Instance is None'
         }
 
-    try:
-        # Try to check if widget is alive
-        is_visible = _layer_manager_instance[0].isVisible()
-        return {
-            'exists': True,
-            'instance': _layer_manager_instance[0],
-            'visible': is_visible,
-            'widget_valid': True
-        }
-    except (RuntimeError, AttributeError) as e:
+    # Reference is nulled on destruction - isValid() is a pointer check covering any gap
+    if not isValid(instance):
         return {
             'exists': False,
-            'reason': f'Widget deleted: {e}',
-            'widget_valid': False
+            'reason': 'C++ object deleted'
         }
 
+    return {
+        'exists': True,
+        'instance': instance,
+        'visible': instance.isVisible(),
+        'widget_valid': True
+    }
+
+
+# Cached 3ds Max main window - it lives for the whole session, so look it up once
+_max_main_window = None
+
+
+def _forget_main_window(*args):
+    """Drop the cached main window (connected to its destroyed signal)"""
+    global _max_main_window
+    _max_main_window = None
+
+
+def _fetch_max_main_window():
+    """Return the 3ds Max main window, calling qtmax only on the first lookup"""
+    global _max_main_window
+
+    if _max_main_window is None:
+        window = qtmax.GetQMaxMainWindow()
+        _max_main_window = window
+        if window is not None:
+            # Refetch on next call if the host window is ever torn down
+            window.destroyed.connect(_forget_main_window)
+    return _max_main_window
+
+
+# qtmax availability is fixed for the session - pick the lookup once at import time
+# (returns None for standalone testing outside 3ds Max)
+_get_max_main_window = _fetch_max_main_window if QTMAX_AVAILABLE else (lambda: None)
+
 
 def show_layer_manager():
     """
@@ -3417,47 +3676,33 @@ def show_layer_manager():
     """
     global _layer_manager_instance
 
-    # Ensure the instance list exists (defensive programming)
-    if '_layer_manager_instance' not in globals():
-        _layer_manager_instance = [None]
-
-    # Check if instance already exists and is valid
-    if _layer_manager_instance[0] is not None:
-        try:
-            # Try to access the widget to see if it's still alive
-            # This will raise RuntimeError if the C++ object was deleted
-            is_visible = _layer_manager_instance[0].isVisible()
-
-            # If we get here, the widget is still valid
-            if is_visible:
-                # Window is visible - CLOSE it (toggle off)
-                _layer_manager_instance[0].close()
-                return None
-            else:
-                # Window exists but hidden - SHOW it (toggle on)
-                _layer_manager_instance[0].show()
-                _layer_manager_instance[0].raise_()
-                _layer_manager_instance[0].activateWindow()
-                return _layer_manager_instance[0]
-
-        except (RuntimeError, AttributeError):
-            # Window was deleted, clear the reference and create new one
-            _layer_manager_instance[0] = None
+    # Check if instance already exists (reference is nulled when the C++ object dies;
+    # isValid() is a pointer check covering any gap, so no RuntimeError probing is needed)
+    instance = _layer_manager_instance
+    if instance is not None and not (isinstance(instance, QtWidgets.QWidget) and isValid(instance)):
+        instance = _layer_manager_instance = None
+    # Created by the class from before a module reload (installer upgrade) - make a new one
+    if instance is not None and type(instance) is not EskiLayerManager:
+        _discard_instance(instance)
+        instance = None
+    if instance is not None:
+        if instance.isVisible():
+            # Window is visible - CLOSE it (toggle off)
+            instance.close()
+            return None
+        else:
+            # Window exists but hidden - SHOW it (toggle on): show, raise_, activateWindow
+            for bring_to_front in instance._front_calls:
+                bring_to_front()
+            return instance
 
     # No valid instance exists, create a new one
 
-    # Get the 3ds Max main window
-    if QTMAX_AVAILABLE:
-        max_main_window = qtmax.GetQMaxMainWindow()
-    else:
-        # Fallback for testing outside 3ds Max
-        max_main_window = None
-
-    # Create the layer manager
-    layer_manager = EskiLayerManager(parent=max_main_window)
+    # Get the 3ds Max main window (None when testing outside 3ds Max)
+    max_main_window = _get_max_main_window()
 
-    # Store reference in the list to prevent garbage collection
-    _layer_manager_instance[0] = layer_manager
+    # Create the layer manager (stores the singleton reference)
+    layer_manager = EskiLayerManager.instance(parent=max_main_window)
 
     # Try to restore saved position
     saved_pos = layer_manager.get_saved_position()
@@ -3467,17 +3712,18 @@ def show_layer_manager():
         if max_main_window:
             # First, add widget to main window (required before restoreState)
             if saved_pos['floating']:
-                # Floating window - add as floating
-                max_main_window.addDockWidget(QtCore.Qt.RightDockWidgetArea, layer_manager)
+                # Floating window - add as floating (skip if already in the right area)
+                if max_main_window.dockWidgetArea(layer_manager) != _RIGHT_DOCK:
+                    max_main_window.addDockWidget(_RIGHT_DOCK, layer_manager)
                 layer_manager.setFloating(True)
                 layer_manager.move(saved_pos['x'], saved_pos['y'])
             else:
                 # Docked window - restore to correct dock area and relative position
-                dock_area = QtCore.Qt.RightDockWidgetArea  # default
+                dock_area = _RIGHT_DOCK  # default
                 if saved_pos['dock_area'] == 'left':
                     dock_area = QtCore.Qt.LeftDockWidgetArea
                 elif saved_pos['dock_area'] == 'right':
-                    dock_area = QtCore.Qt.RightDockWidgetArea
+                    dock_area = _RIGHT_DOCK
 
                 # Try to find a reference widget to split from
                 reference_widget = None
@@ -3534,8 +3780,9 @@ def show_layer_manager():
         # No saved position - use default: floating and centered
 
         if max_main_window:
-            # Add as floating widget
-            max_main_window.addDockWidget(QtCore.Qt.RightDockWidgetArea, layer_manager)
+            # Add as floating widget (skip if already in the right area)
+            if max_main_window.dockWidgetArea(layer_manager) != _RIGHT_DOCK:
+                max_main_window.addDockWidget(_RIGHT_DOCK, layer_manager)
             layer_manager.setFloating(True)
 
             # Center on screen
@@ -3549,21 +3796,68 @@ def show_layer_manager():
                 # Fallback if screen geometry not available
                 layer_manager.move(100, 100)
 
-    layer_manager.show()
+    # addDockWidget on a visible main window already shows the dock - skip the redundant show()
+    if not layer_manager.isVisible():
+        layer_manager.show()
+
+    # Later calls only toggle this instance - skip the creation/docking checks
+    globals()['show_layer_manager'] = _make_fast_toggle(layer_manager)
 
     return layer_manager
 
 
+# Full show_layer_manager, restored whenever the fast toggle finds its instance gone
+_show_layer_manager_full = show_layer_manager
+
+
+def _make_fast_toggle(layer_manager):
+    """Return a steady-state show_layer_manager bound to an existing instance"""
+    front_calls = layer_manager._front_calls
+
+    def fast_toggle():
+        if _layer_manager_instance is not layer_manager or not isValid(layer_manager):
+            # Instance was replaced or destroyed - fall back to the full path
+            globals()['show_layer_manager'] = _show_layer_manager_full
+            return _show_layer_manager_full()
+
+        if layer_manager.isVisible():
+            # Window is visible - CLOSE it (toggle off)
+            layer_manager.close()
+            return None
+
+        # Window exists but hidden - SHOW it (toggle on)
+        for bring_to_front in front_calls:
+            bring_to_front()
+        return layer_manager
+
+    fast_toggle.__doc__ = _show_layer_manager_full.__doc__
+    return fast_toggle
+
+
 # For testing or direct execution
-if __name__ == "__main__":
-    # This allows testing outside 3ds Max with a standalone Qt application
+def _make_qapp():
+    """Create the standalone QApplication (QApplication.instance() returns it from then on)"""
+    import sys
+
+    # Must be set before the application is constructed
+    QtCore.QCoreApplication.setAttribute(QtCore.Qt.AA_ShareOpenGLContexts)
+    return QtWidgets.QApplication(sys.argv)
+
+
+def _standalone_main():
+    """Run the layer manager in a standalone Qt application (testing outside 3ds Max)"""
     import sys
 
-    app = QtWidgets.QApplication.instance()
-    if not app:
-        app = QtWidgets.QApplication(sys.argv)
+    # Reuse the process-wide application if one already exists (repeated test runs)
+    app = QtWidgets.QApplication.instance() or _make_qapp()
 
     window = EskiLayerManager()
+    # closeEvent only hides the window, so quit explicitly once it is hidden
+    window.visibilityChanged.connect(lambda visible: visible or app.quit())
     window.show()
 
     sys.exit(app.exec())
+
+
+if __name__ == "__main__":
+    _standalone_main()
@@ -57,11 +57,10 @@ for i in range(3):
     instance = eski_layer_manager.show_layer_manager()
     print(f"  Call {i+1}: id={id(instance)}, same={instance is instance1}")
 
-# Test 6: Check instance list
-print("\n[TEST 6] Checking internal instance list...")
-print(f"Instance list: {eski_layer_manager._layer_manager_instance}")
-print(f"Instance list[0]: {eski_layer_manager._layer_manager_instance[0]}")
-print(f"Is same as instance1: {eski_layer_manager._layer_manager_instance[0] is instance1}")
+# Test 6: Check instance reference
+print("\n[TEST 6] Checking internal instance reference...")
+print(f"Instance: {eski_layer_manager._layer_manager_instance}")
+print(f"Is same as instance1: {eski_layer_manager._layer_manager_instance is instance1}")
 
 print("\n" + "="*70)
 print("TEST COMPLETE")